@@ -0,0 +1,168 @@
+# bench.py — display benchmarks for the 72x40 SH1106 window
+#
+# Run it from Thonny (it is not in the menu) and read the results in the console.
+# Use it to pick the fastest settings that work on a batch of boards.
+#
+# I2C transport: for each bus clock and transport (bulk = one transaction
+# per page, chunked = old one-command-per-transaction / 16-byte data writes)
+# reports transactions, bytes and microseconds per frame, for a full frame
+# and for a small partial update.
+#
+# Text: the old per-pixel renderer, the glyph atlas, and cached text strips.
+#
+# Images: create_image() with the exact (float, per-pixel) scaler and the
+# fast integer packer, and whether both give the same bytes.
+
+from simple_esp import SmallDisplay
+from logo import logo
+import time
+
+FRAMES = 20
+CLOCKS = (100000, 400000, 1000000)
+
+disp = SmallDisplay()
+
+
+def draw_pattern():
+    """Something that touches every page and column."""
+    disp.fill(0)
+    for x in range(0, disp.width, 4):
+        disp.line(x, 0, disp.width - 1 - x, disp.height - 1, 1)
+    disp.rect(0, 0, disp.width, disp.height, 1)
+
+
+def time_frames(full):
+    """Average (transactions, bytes, us) per frame over FRAMES flushes."""
+    d = disp.driver
+    d.reset_counters()
+    t0 = time.ticks_us()
+    for i in range(FRAMES):
+        if full:
+            d.invalidate()
+        else:
+            disp.fill_rect(30, 16, 8, 8, i & 1)  # e.g. a moving sprite
+        d.show()  # straight to the driver so a NACK is reported, not retried
+    us = time.ticks_diff(time.ticks_us(), t0)
+    return d.transactions // FRAMES, d.bytes_sent // FRAMES, us // FRAMES
+
+
+def bench_transport():
+    print("--- I2C transport ({} frames each) ---".format(FRAMES))
+    print("{:>8} {:<8} {:<8} {:>4} {:>6} {:>8}".format("clock", "mode", "frame", "tx", "bytes", "us"))
+    d = disp.driver
+    for freq in CLOCKS:
+        d.i2c = disp.new_i2c(freq)
+        for chunked in (False, True):
+            d.chunked = chunked
+            mode = "chunked" if chunked else "bulk"
+            draw_pattern()
+            try:
+                for full in (True, False):
+                    tx, nbytes, us = time_frames(full)
+                    print("{:>8} {:<8} {:<8} {:>4} {:>6} {:>8}".format(
+                        freq, mode, "full" if full else "partial", tx, nbytes, us))
+            except OSError as e:
+                print("{:>8} {:<8} NACK ({})".format(freq, mode, e))
+    # Back to what the constructor picked
+    d.chunked = False
+    d.i2c = disp.open_bus()
+    d.invalidate()
+    print("SmallDisplay() settles on", disp.freq, "Hz")
+
+
+TEXT_LINES = ["Hello world!!!", "SCORE 1234", "abcdefghijklmn", "Click: next", "0123456789"]
+
+
+def small_text_pixels(s, x, y):
+    """The original small_text(): 35 pixel() calls per character."""
+    px = x
+    for ch in s:
+        g = disp.glyph5x7(ch)
+        if g is None:
+            px += 5; continue
+        for cx in range(5):
+            yy = y; m = g[cx]
+            for _ in range(7):
+                disp.pixel(px + cx, yy, m & 1)
+                m >>= 1; yy += 1
+        px += 5
+
+
+def time_text(draw):
+    t0 = time.ticks_us()
+    for _ in range(FRAMES):
+        y = 0
+        for line in TEXT_LINES:
+            draw(line, 0, y)
+            y += 8
+    return time.ticks_diff(time.ticks_us(), t0) // FRAMES
+
+
+def bench_text():
+    chars = sum(len(line) for line in TEXT_LINES)
+    print("--- small_text ({} lines, {} chars per screen) ---".format(len(TEXT_LINES), chars))
+    mirror = disp.mirror
+    cache = disp.text_cache
+    disp.mirror = None
+    old = time_text(small_text_pixels)
+    disp.text_cache = None
+    atlas = time_text(disp.small_text)
+    disp.text_cache = cache
+    if cache is not None:
+        cache.clear()
+    cached = time_text(disp.small_text)
+    disp.mirror = mirror
+    print("per-pixel   {:>7} us/screen".format(old))
+    print("glyph atlas {:>7} us/screen".format(atlas))
+    print("text cache  {:>7} us/screen  {}".format(cached, disp.cache_stats()))
+    disp.show()
+
+
+FACE = """
+  ####    ####
+ ######  ######
+  ####    ####
+
+#              #
+ #            #
+  ############
+"""
+
+IMAGES = [("logo", logo, 72, 40), ("face", FACE, 72, 24), ("face", FACE, 72, 40)]
+
+
+def time_image(art, w, h, exact):
+    t0 = time.ticks_us()
+    for _ in range(FRAMES):
+        fb = disp.create_image(art, target_w=w, target_h=h, exact=exact, cache=False)
+    return time.ticks_diff(time.ticks_us(), t0) // FRAMES, fb
+
+
+def bench_images():
+    print("--- create_image ({} runs each) ---".format(FRAMES))
+    print("{:<6} {:>6} {:>8} {:>8} {:>5}".format("art", "size", "exact", "fast", "same"))
+    for name, art, w, h in IMAGES:
+        us_exact, fb_exact = time_image(art, w, h, True)
+        us_fast, fb_fast = time_image(art, w, h, False)
+        same = True
+        for y in range(h):
+            for x in range(w):
+                if fb_exact.pixel(x, y) != fb_fast.pixel(x, y):
+                    same = False
+                    break
+            if not same:
+                break
+        print("{:<6} {:>6} {:>8} {:>8} {:>5}".format(
+            name, "{}x{}".format(w, h), us_exact, us_fast, "yes" if same else "NO"))
+
+
+def main():
+    disp.display_message(["Benchmark", "see console"], delay_ms=0)
+    bench_transport()
+    bench_text()
+    bench_images()
+    disp.display_message(["Benchmark", "done"], delay_ms=1000)
+
+
+if __name__ == "__main__":
+    main()
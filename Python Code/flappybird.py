@@ -7,7 +7,8 @@
 #   - While on GAME OVER screen: press to restart (after a short delay)
 #   - Long press: full reset back to title
 
-from simple_esp import SmallDisplay, Input, Registry
+from simple_esp import SmallDisplay, Input, Registry, measure
+from sprites import Scene, Sprite
 from machine import Pin
 import time
 
@@ -33,6 +34,7 @@ SPEED = 1                # how many pixels pipes move left each frame
 
 FPS = 60
 FRAME_MS = int(1000 / FPS)
+SHOW_STATS = False       # True: frames per second and ms per show() in the corner
 
 # ---------------------------------------------------------
 # DIFFICULTY SETTINGS
@@ -59,7 +61,15 @@ GAP_MARGIN = 4
 # ---------------------------------------------------------
 # GAME STATE
 # ---------------------------------------------------------
-disp = SmallDisplay()
+# double_buffer: the screen is sent in the background while we work out
+# the next frame, so a slow screen doesn't slow the bird down
+disp = SmallDisplay(double_buffer=True)
+disp.set_stats(SHOW_STATS, target_fps=FPS, overlay=SHOW_STATS)
+# The game is drawn as sprites: each frame only the places where the bird,
+# a pipe or the score moved are redrawn and sent to the screen
+scene = Scene(disp)
+bird = None
+score_text = None
 registry = Registry()
 # Button on pin 9. We will use:
 #   - on_press      for flapping / restarting
@@ -80,6 +90,7 @@ vel = 0.0                     # bird's up/down speed
 #   "gap_height": height of the gap,
 #   "width": how thick the pipe is,
 #   "scored": True/False if we've already counted a point for this pipe
+#   "top", "bottom": the two sprites that draw it
 # }
 pipes = []
 pipe_count = 0           # how many pipes have been created in this run
@@ -184,12 +195,18 @@ def spawn_pipe(start_x=None):
     gap_height, pipe_width = get_pipe_difficulty(pipe_count)
     gap_center_y = choose_gap_center_y(gap_height)
 
+    top_pipe_height = gap_center_y - gap_height // 2
+    bottom_pipe_y = gap_center_y + gap_height // 2
+
     pipes.append({
         "x": x,
         "gap_y": gap_center_y,
         "gap_height": gap_height,
         "width": pipe_width,
-        "scored": False
+        "scored": False,
+        # Pipes go under the bird and the score
+        "top": scene.add(Sprite(pipe_width, top_pipe_height, x, 0), 0),
+        "bottom": scene.add(Sprite(pipe_width, SCREEN_HEIGHT - bottom_pipe_y, x, bottom_pipe_y), 0),
     })
 
     pipe_count += 1
@@ -199,7 +216,7 @@ def reset_game():
     Reset everything for a new run,
     but keep the 'best' (high score).
     """
-    global score, bird_y, vel, pipes, state, pipe_count
+    global score, bird_y, vel, pipes, state, pipe_count, bird, score_text
 
     # Make the level the same every time
     seed_rng(1)
@@ -210,6 +227,11 @@ def reset_game():
     pipes = []
     pipe_count = 0
 
+    scene.clear()
+    scene.invalidate()   # the title screen is drawn over the game
+    bird = scene.add(Sprite(BIRD_SIZE, BIRD_SIZE))
+    score_text = scene.add(Sprite(text=""))
+
     # Create a few pipes ahead of the bird
     spawn_pipe(SCREEN_WIDTH + 20)
     spawn_pipe(pipes[-1]["x"] + PIPE_SPACING)
@@ -222,34 +244,24 @@ def reset_game():
 # DRAWING FUNCTIONS
 # ---------------------------------------------------------
 def draw_bird(x, y):
-    """Draw a 3x3 square for the bird."""
-    top = int(y) - BIRD_SIZE // 2
-    disp.fill_rect(x - 1, top, 3, 3, 1)
+    """Move the bird sprite (a 3x3 square) to x, y."""
+    bird.move(x - 1, int(y) - BIRD_SIZE // 2)
 
 def draw_pipes():
-    """Draw all pipes from the pipes list."""
+    """Move the pipe sprites to where the pipes are now."""
     for pipe in pipes:
         x = pipe["x"]
-        gap_y = pipe["gap_y"]
-        gap_height = pipe["gap_height"]
-        width = pipe["width"]
-
-        top_pipe_height = gap_y - gap_height // 2
-        bottom_pipe_y = gap_y + gap_height // 2
-
         # Top pipe (from top of screen down to top of gap)
-        if top_pipe_height > 0:
-            disp.fill_rect(x, 0, width, top_pipe_height, 1)
-
+        pipe["top"].move(x, 0)
         # Bottom pipe (from bottom of gap down to bottom of screen)
-        if bottom_pipe_y < SCREEN_HEIGHT:
-            disp.fill_rect(x, bottom_pipe_y, width, SCREEN_HEIGHT - bottom_pipe_y, 1)
+        pipe["bottom"].move(x, pipe["bottom"].y)
 
 def draw_score():
-    """Draw the current score in the top-right corner."""
+    """Put the current score in the top-right corner."""
     s = str(score)
-    x = max(0, SCREEN_WIDTH - len(s) * 6)  # font is ~6 pixels wide per letter
-    disp.small_text(s, x, 0)
+    x = max(0, SCREEN_WIDTH - measure(s))
+    score_text.set_text(s)
+    score_text.move(x, 0)
 
 def draw_title_screen():
     """Show the title screen."""
@@ -276,10 +288,10 @@ def draw_game():
     if state == "dead":
         # When dead, we keep showing the GAME OVER screen instead
         return
-    disp.fill(0)
     draw_pipes()
     draw_bird(BIRD_X, bird_y)
     draw_score()
+    scene.render()
     disp.show()
 
 # ---------------------------------------------------------
@@ -334,7 +346,9 @@ def update_game():
 
     # 3) Remove pipes that are off the left side of the screen
     while pipes and pipes[0]["x"] + pipes[0]["width"] < 0:
-        pipes.pop(0)
+        pipe = pipes.pop(0)
+        scene.remove(pipe["top"])
+        scene.remove(pipe["bottom"])
 
     # 4) Add new pipes on the right side when needed
     while pipes and pipes[-1]["x"] < SCREEN_WIDTH:
@@ -1,8 +1,8 @@
-from simple_esp import SmallDisplay, Input
-import time
+from simple_esp import SmallDisplay, Input, run
 from machine import Pin
 
 display = SmallDisplay()
+display.set_power()  # dim, then switch off the screen when left alone
 inp = Input(9)
 led = Pin(8, Pin.OUT)
 
@@ -50,10 +50,10 @@ blank = """
   ####  
 """
 
-smile_image = display.create_image(smile)
-sad_image = display.create_image(sad)
-neutral_image = display.create_image(neutral)
-blank_image = display.create_image(blank)
+smile_image = display.create_image(smile, name="happy.smile")
+sad_image = display.create_image(sad, name="happy.sad")
+neutral_image = display.create_image(neutral, name="happy.neutral")
+blank_image = display.create_image(blank, name="happy.blank")
 
 happy = False
 
@@ -80,18 +80,23 @@ def toggle_image():
         led.value(1)
     display.show()
 
-def main():    # Wire up button events
-    inp.on_click = toggle_image
-    inp.on_long_click = show_neutral
-    inp.on_double_click = show_blank
-
+async def app():
     # Start state
     show_neutral()
     led.value(0)
 
-    # Idle loop (events do the work)
+    # Sleep until the button does something
     while True:
-        time.sleep(0.1)
+        kind, _ = await inp.event()
+        if kind == "click":
+            toggle_image()
+        elif kind == "long":
+            show_neutral()
+        elif kind == "double":
+            show_blank()
+
+def main():
+    run(app())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,8 +1,7 @@
 from simple_esp import SmallDisplay
 import time
 
-def main():
-    logo = """
+logo = """
                                       #                                     
                                      ###                                    
                                     #####                                   
@@ -55,8 +54,9 @@ def main():
                                      ###                                    
 """
 
+def main():
     display = SmallDisplay()
-    logo_image = display.create_image(logo, reusable=True)
+    logo_image = display.create_image(logo, reusable=True, name="logo")
     display.image(logo_image)
     display.show()
     time.sleep(2)
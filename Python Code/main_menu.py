@@ -21,6 +21,9 @@ EXCLUDED_FILES = {
     "main_menu.py",
     "simple_esp.py",
     "sh1106.py",
+    "assets.py",
+    "sprites.py",
+    "bench.py",
 }
 
 def discover_programs():
@@ -80,6 +83,11 @@ def _run_app(module_name):
     else:
         _display.display_message(["No main()", module_name], delay_ms=2000)
 
+    # Stop a background frame sender and the screen dimming the app may
+    # have left running (set_power(False) also wakes the screen)
+    _display.set_double_buffer(False)
+    _display.set_power(False)
+
     # Free the module after it returns
     try:
         del mod
@@ -102,8 +110,7 @@ def _main_loop():
 def main():
     global _display, _btn
 
-    _display = SmallDisplay()
-    _display.hard_reset()
+    _display = SmallDisplay()  # apps' SmallDisplay() reuse this panel setup
     _btn = Input(pin_no=9)
 
     _run_app('logo')
@@ -20,7 +20,7 @@
 #   kind   = "D" (discover), "I" (identity), "M" (message)
 #   payload= text (for "M"), empty for "D" and "I"
 
-from simple_esp import Input, SmallDisplay, Bluetooth, Keyboard, Registry
+from simple_esp import Input, SmallDisplay, Bluetooth, Keyboard, Registry, idle_ms
 from machine import Pin
 import time
 
@@ -39,6 +39,7 @@ current_index = 0     # which item in the target list is highlighted
 # ---------------------------
 bus = Bluetooth()
 display = SmallDisplay()
+display.set_power()  # dim, then switch off the screen; a click or message wakes it
 registry = Registry()
 led = Pin(8, Pin.OUT)
 inp = Input(9)
@@ -387,7 +388,7 @@ def main():
     draw_menu()
 
     while True:
-        time.sleep_ms(50)  # everything else happens in callbacks/IRQs
+        idle_ms(50)  # everything else happens in callbacks/IRQs
 
 
 if __name__ == "__main__":
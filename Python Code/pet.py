@@ -13,7 +13,7 @@
 # Instructions:
 #   Shown once at start; first click hides them and starts the game.
 
-from simple_esp import SmallDisplay, Input
+from simple_esp import SmallDisplay, Input, idle_ms, set_light_sleep
 from machine import Pin
 import time
 
@@ -28,6 +28,11 @@ DIRTY_RATE   = 4  # +1 dirty every 4 ticks
 
 # ---- Hardware ----
 display = SmallDisplay()
+# Every screen is redrawn in full, but usually little changes: retained mode
+# only sends the parts that differ from the last screen
+display.set_retained(True)
+# Dim the screen after a while without a click, then switch it off
+display.set_power()
 button = Input(9)
 led = Pin(8, Pin.OUT)
 
@@ -108,10 +113,10 @@ dead_face = """
 FACE_W = 72
 FACE_H = 24
 
-happy_img  = display.create_image(happy_face,  target_w=FACE_W, target_h=FACE_H, reusable=False)
-ok_img     = display.create_image(ok_face,     target_w=FACE_W, target_h=FACE_H, reusable=False)
-sad_img    = display.create_image(sad_face,    target_w=FACE_W, target_h=FACE_H, reusable=False)
-dead_img   = display.create_image(dead_face,   target_w=FACE_W, target_h=FACE_H, reusable=False)
+happy_img  = display.create_image(happy_face,  target_w=FACE_W, target_h=FACE_H, reusable=False, name="pet.happy")
+ok_img     = display.create_image(ok_face,     target_w=FACE_W, target_h=FACE_H, reusable=False, name="pet.ok")
+sad_img    = display.create_image(sad_face,    target_w=FACE_W, target_h=FACE_H, reusable=False, name="pet.sad")
+dead_img   = display.create_image(dead_face,   target_w=FACE_W, target_h=FACE_H, reusable=False, name="pet.dead")
 
 
 # ---- Helpers ----
@@ -299,12 +304,23 @@ def main():
 
     _last_tick_ms = time.ticks_ms()
 
-    while True:
-        now = time.ticks_ms()
-        if not show_help and time.ticks_diff(now, _last_tick_ms) >= TICK_MS:
-            _last_tick_ms = now
-            tick_pet()
-        time.sleep_ms(50)
+    # Sleep the CPU between clicks and pet ticks; a click wakes it
+    set_light_sleep()
+    try:
+        while True:
+            now = time.ticks_ms()
+            if not show_help and time.ticks_diff(now, _last_tick_ms) >= TICK_MS:
+                _last_tick_ms = now
+                tick_pet()
+            if show_help:
+                # a click can hide the help at any moment
+                idle_ms(50)
+                continue
+            # Nothing to do until the next tick; clicks are handled in callbacks
+            wait = TICK_MS - time.ticks_diff(time.ticks_ms(), _last_tick_ms)
+            idle_ms(max(10, wait))
+    finally:
+        set_light_sleep(False)
 
 
 if __name__ == "__main__":
@@ -1,4 +1,8 @@
-# sh1106.py — MicroPython SH1106 I2C driver (chunked writes, 128x64 or 128x32)
+# sh1106.py — MicroPython SH1106 I2C driver (128x64 or 128x32)
+# show() only sends the pages / column spans changed since the last show().
+# SH1106_I2C sends each page span plus its addressing as one I2C transaction.
+# scroll_pages() scrolls whole pages with the display start line, so only the
+# newly exposed pages have to be sent.
 from micropython import const
 import framebuf
 
@@ -23,84 +27,274 @@ SET_VCOM_DESEL      = const(0xDB)
 SET_CHARGE_PUMP     = const(0x8D)  # often ignored on SH1106 modules
 
 class SH1106:
-    def __init__(self, width, height, external_vcc=False, col_offset=2):
+    def __init__(self, width, height, external_vcc=False, col_offset=2, page_offset=0, panel_height=None):
         self.width = width
         self.height = height
         self.external_vcc = external_vcc
         self.pages = self.height // 8
         self.col_offset = col_offset  # SH1106 has 132 columns; visible window usually starts at 2
+        # The buffer may cover only part of the panel: it starts at RAM page
+        # page_offset, and panel_height (default: height) configures the COMs.
+        self.page_offset = page_offset
+        self.panel_height = panel_height or height
+        self.panel_pages = self.panel_height // 8
         self.buffer = bytearray(self.pages * self.width)
         self.framebuf = framebuf.FrameBuffer(self.buffer, self.width, self.height, framebuf.MONO_VLSB)
+        # Dirty span per page: first/last changed column since the last flush.
+        # lo > hi means the page is clean.
+        self._dirty_lo = bytearray(self.pages)
+        self._dirty_hi = bytearray(self.pages)
+        # Start line in pages: buffer page p lives in RAM page
+        # (page_offset + p + start_page) % panel_pages. _start_sent is what the panel has.
+        self.start_page = 0
+        self._start_sent = 0
+        self.draw_calls = 0  # drawing operations recorded by _mark()
+        self.frames = 0      # frames handed to flush(), by show() or take_dirty()
+        self.contrast_level = 0x8F  # last value set by contrast() / init_display()
+        self.invalidate()
         self.init_display()
 
-    # FrameBuffer passthroughs
-    def fill(self, c): self.framebuf.fill(c)
-    def pixel(self, x, y, c): self.framebuf.pixel(x, y, c)
-    def text(self, s, x, y): self.framebuf.text(s, x, y)
-    def hline(self, x, y, w, c): self.framebuf.hline(x, y, w, c)
-    def vline(self, x, y, h, c): self.framebuf.vline(x, y, h, c)
-    def line(self, x1, y1, x2, y2, c): self.framebuf.line(x1, y1, x2, y2, c)
-    def rect(self, x, y, w, h, c): self.framebuf.rect(x, y, w, h, c)
-    def blit(self, fb_source, x, y, key, pallet): self.framebuf.blit(fb_source, x, y, key, pallet)
-    def fill_rect(self, x, y, w, h, c,): self.framebuf.fill_rect(x, y, w, h, c)
-    def ellipse(self, x, y, xr, yr, color): self.framebuf.ellipse(x, y, xr, yr, color)
+    # FrameBuffer passthroughs (each one records the area it touched)
+    def fill(self, c): self.framebuf.fill(c); self.invalidate()
+    def pixel(self, x, y, c): self.framebuf.pixel(x, y, c); self._mark(x, y, x, y)
+    def text(self, s, x, y, c=1): self.framebuf.text(s, x, y, c); self._mark(x, y, x + 8 * len(s) - 1, y + 7)
+    def hline(self, x, y, w, c): self.framebuf.hline(x, y, w, c); self._mark(x, y, x + w - 1, y)
+    def vline(self, x, y, h, c): self.framebuf.vline(x, y, h, c); self._mark(x, y, x, y + h - 1)
+    def line(self, x1, y1, x2, y2, c): self.framebuf.line(x1, y1, x2, y2, c); self._mark(min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+    def rect(self, x, y, w, h, c): self.framebuf.rect(x, y, w, h, c); self._mark(x, y, x + w - 1, y + h - 1)
+    def fill_rect(self, x, y, w, h, c): self.framebuf.fill_rect(x, y, w, h, c); self._mark(x, y, x + w - 1, y + h - 1)
+    def ellipse(self, x, y, xr, yr, color): self.framebuf.ellipse(x, y, xr, yr, color); self._mark(x - xr, y - yr, x + xr, y + yr)
+    def scroll(self, dx, dy): self.framebuf.scroll(dx, dy); self.invalidate()
     def poweroff(self): self.write_cmd(SET_DISP_OFF)
     def poweron(self):  self.write_cmd(SET_DISP_ON)
     def invert(self, inv): self.write_cmd(SET_NORM_INV | (inv & 1))
-    def contrast(self, val): self.write_cmd(SET_CONTRAST); self.write_cmd(val & 0xFF)
+    def contrast(self, val): self.write_cmds((SET_CONTRAST, val & 0xFF)); self.contrast_level = val & 0xFF
+
+    def blit(self, fb_source, x, y, key=-1, pallet=None, w=None, h=None):
+        # FrameBuffer does not expose its size, so without w/h we assume the
+        # source reaches the bottom-right corner of the buffer.
+        self.framebuf.blit(fb_source, x, y, key, pallet)
+        self._mark(x, y, self.width - 1 if w is None else x + w - 1,
+                   self.height - 1 if h is None else y + h - 1)
+
+    # --- dirty tracking
+    def _mark(self, x0, y0, x1, y1):
+        self.draw_calls += 1
+        if x0 < 0: x0 = 0
+        if y0 < 0: y0 = 0
+        if x1 >= self.width: x1 = self.width - 1
+        if y1 >= self.height: y1 = self.height - 1
+        if x0 > x1 or y0 > y1:
+            return
+        lo = self._dirty_lo
+        hi = self._dirty_hi
+        for page in range(y0 >> 3, (y1 >> 3) + 1):
+            if x0 < lo[page]: lo[page] = x0
+            if x1 > hi[page]: hi[page] = x1
+
+    def mark_dirty(self, x, y, w, h):
+        """Record a change made directly to self.buffer / self.framebuf."""
+        self._mark(x, y, x + w - 1, y + h - 1)
+
+    def invalidate(self):
+        """Mark the whole buffer as changed (next show() sends everything)."""
+        last = self.width - 1
+        for page in range(self.pages):
+            self._dirty_lo[page] = 0
+            self._dirty_hi[page] = last
+
+    def is_dirty(self):
+        lo = self._dirty_lo
+        hi = self._dirty_hi
+        for page in range(self.pages):
+            if lo[page] <= hi[page]:
+                return True
+        return False
+
+    def scroll_pages(self, n):
+        """
+        Scroll the buffer up by n pages (down if n < 0), like scroll(0, -8 * n),
+        but by moving the display start line instead of resending the frame:
+        only the n pages that scroll in are marked dirty. Their old contents
+        stay in the buffer, so the caller normally redraws them.
+        """
+        pages = self.pages
+        if n == 0:
+            return
+        if not -pages < n < pages:
+            self.scroll(0, -8 * n)
+            return
+        self.framebuf.scroll(0, -8 * n)
+        lo = self._dirty_lo
+        hi = self._dirty_hi
+        if n > 0:
+            for page in range(pages - n):
+                lo[page] = lo[page + n]
+                hi[page] = hi[page + n]
+            exposed = range(pages - n, pages)
+        else:
+            for page in range(pages - 1, -n - 1, -1):
+                lo[page] = lo[page + n]
+                hi[page] = hi[page + n]
+            exposed = range(-n)
+        for page in exposed:
+            lo[page] = 0
+            hi[page] = self.width - 1
+        self.start_page = (self.start_page + n) % self.panel_pages
 
     def init_display(self):
-        for cmd in (
+        self.write_cmds((
             SET_DISP_OFF,
             SET_DISP_CLK_DIV, 0x80,
-            SET_MUX_RATIO, self.height - 1,     # 0x3F for 64, 0x1F for 32
+            SET_MUX_RATIO, self.panel_height - 1,   # 0x3F for 64, 0x1F for 32
             SET_DISP_OFFSET, 0x00,
             SET_DISP_START_LINE | 0x00,
             SET_SEG_REMAP_1,                    # mirror horizontally to match common wiring
             SET_COM_OUT_DIR_REM,                # scan from COM[N-1] to COM0
-            SET_COM_PIN_CFG, 0x12 if self.height == 64 else 0x02,
-            SET_CONTRAST, 0x8F,
+            SET_COM_PIN_CFG, 0x12 if self.panel_height == 64 else 0x02,
+            SET_CONTRAST, self.contrast_level,
             SET_PRECHARGE, 0x1F,
             SET_VCOM_DESEL, 0x40,
             SET_ENTIRE_ON_FOL,
             SET_NORM_INV,
             SET_DISP_ON,
-        ):
-            self.write_cmd(cmd)
+        ))
+        self.start_page = self._start_sent = 0
         self.fill(0)
         self.show()
 
     def show(self):
-        # SH1106 uses page addressing; set page and column (with offset) per page.
+        self.frames += 1
+        self.flush(self.buffer, self._dirty_lo, self._dirty_hi, self.start_page)
+
+    def flush(self, buf, lo, hi, start_page=0):
+        """
+        Send the dirty spans lo/hi of buf (laid out like self.buffer) and mark
+        them clean, then move the start line to start_page. show() flushes our
+        own buffer; a background flusher can pass a copy taken with
+        take_dirty().
+        """
+        # SH1106 uses page addressing; set page and column (with offset) for
+        # each page that changed and send only its dirty column span.
+        # Pages are written before the start line moves, so pages scrolling
+        # in are already in place when they appear.
+        ram_page = self.page_offset + start_page
         for page in range(self.pages):
-            self.write_cmd(0xB0 | page)                        # set page addr
-            self.write_cmd(0x00 | ((self.col_offset) & 0x0F))  # low column start
-            self.write_cmd(0x10 | ((self.col_offset) >> 4))    # high column start
-            # write one page (width bytes) in safe chunks
+            c0 = lo[page]
+            c1 = hi[page]
+            if c0 > c1:
+                continue
             start = self.width * page
-            mv = memoryview(self.buffer)[start:start + self.width]
-            for i in range(0, self.width, 16):
-                self.write_data(mv[i:i+16])
+            self.write_page((page + ram_page) % self.panel_pages, self.col_offset + c0,
+                            memoryview(buf)[start + c0:start + c1 + 1])
+            lo[page] = 0xFF
+            hi[page] = 0
+        if start_page != self._start_sent:
+            self.write_cmds((SET_DISP_START_LINE | (start_page << 3),))
+            self._start_sent = start_page
+
+    def take_dirty(self, lo, hi):
+        """
+        Move the pending dirty spans into lo/hi, leaving ours clean. Returns
+        the start_page to flush them with.
+        """
+        self.frames += 1
+        self.save_dirty(lo, hi)
+        for page in range(self.pages):
+            self._dirty_lo[page] = 0xFF
+            self._dirty_hi[page] = 0
+        return self.start_page
+
+    def save_dirty(self, lo, hi):
+        """Copy the pending dirty spans into lo/hi. Not counted as a frame."""
+        lo[:] = self._dirty_lo
+        hi[:] = self._dirty_hi
+
+    def restore_dirty(self, lo, hi):
+        """Put back spans copied out with save_dirty()."""
+        self._dirty_lo[:] = lo
+        self._dirty_hi[:] = hi
 
     # Hooks implemented by subclasses
     def write_cmd(self, cmd): raise NotImplementedError
     def write_data(self, buf): raise NotImplementedError
 
+    # Transports that can batch override these
+    def write_cmds(self, cmds):
+        for cmd in cmds:
+            self.write_cmd(cmd)
+
+    def write_page(self, page, col, buf):
+        self.write_cmd(0xB0 | page)           # set page addr
+        self.write_cmd(0x00 | (col & 0x0F))   # low column start
+        self.write_cmd(0x10 | (col >> 4))     # high column start
+        # write the span in safe chunks
+        for i in range(0, len(buf), 16):
+            self.write_data(buf[i:i+16])
+
 class SH1106_I2C(SH1106):
-    def __init__(self, width, height, i2c, addr=0x3C, external_vcc=False, col_offset=2):
+    """
+    I2C transport.
+
+    Each page is sent as ONE transaction: three Co=1 command bytes for the
+    page/column address followed by a Co=0 data run, and command sequences
+    go out as one Co=0 command run. chunked=True restores the old behaviour
+    (one transaction per command byte, data in 16-byte pieces) for panels
+    that choke on long writes.
+
+    transactions / bytes_sent count what went over the bus (payload bytes,
+    not counting the address byte).
+    """
+    def __init__(self, width, height, i2c, addr=0x3C, external_vcc=False, col_offset=2, page_offset=0, panel_height=None, chunked=False):
         self.i2c = i2c
         self.addr = addr
-        super().__init__(width, height, external_vcc, col_offset)
+        self.chunked = chunked
+        # control, page, control, col low, control, col high, data follows
+        self._page_hdr = bytearray(b'\x80\xb0\x80\x00\x80\x10\x40')
+        self.reset_counters()
+        super().__init__(width, height, external_vcc, col_offset, page_offset, panel_height)
+
+    def reset_counters(self):
+        self.transactions = 0
+        self.bytes_sent = 0
 
     def write_cmd(self, cmd):
+        self.transactions += 1
+        self.bytes_sent += 2
         try:
             self.i2c.writevto(self.addr, (b'\x80', bytes([cmd])))
         except AttributeError:
             self.i2c.writeto(self.addr, bytes((0x80, cmd)))
 
     def write_data(self, buf):
+        self.transactions += 1
+        self.bytes_sent += 1 + len(buf)
         try:
             self.i2c.writevto(self.addr, (b'\x40', buf))
         except AttributeError:
             self.i2c.writeto(self.addr, b'\x40' + bytes(buf))
 
+    def write_cmds(self, cmds):
+        if self.chunked:
+            return super().write_cmds(cmds)
+        cmds = bytes(cmds)
+        self.transactions += 1
+        self.bytes_sent += 1 + len(cmds)
+        try:
+            self.i2c.writevto(self.addr, (b'\x00', cmds))
+        except AttributeError:
+            self.i2c.writeto(self.addr, b'\x00' + cmds)
+
+    def write_page(self, page, col, buf):
+        if self.chunked:
+            return super().write_page(page, col, buf)
+        hdr = self._page_hdr
+        hdr[1] = 0xB0 | page
+        hdr[3] = col & 0x0F
+        hdr[5] = 0x10 | (col >> 4)
+        self.transactions += 1
+        self.bytes_sent += 7 + len(buf)
+        try:
+            self.i2c.writevto(self.addr, (hdr, buf))
+        except AttributeError:
+            self.i2c.writeto(self.addr, bytes(hdr) + bytes(buf))
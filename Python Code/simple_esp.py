@@ -1,5 +1,7 @@
 # simple_esp.py — ESP32-C3 helpers for 72x40 SH1106 display, buttons, servos and bluetooth BLE
-# - Timers: Input=Timer(0), BLE=Timer(1)
+# - Timers: one hardware Timer(0), shared through TimerService (Input, BLE, apps)
+# - Idle: idle_ms() dims the screen (set_power) and light-sleeps the CPU (set_light_sleep)
+# - asyncio (optional): run(), Input.event(), Bluetooth.recv(), SmallDisplay.next_frame()
 # - 14-char truncation
 
 from machine import Pin, Timer, unique_id
@@ -75,6 +77,17 @@ def _ensure_os():
         _os = os
     return _os
 
+_OrderedDict = None
+def _ensure_ordereddict():
+    global _OrderedDict
+    if _OrderedDict is None:
+        try:
+            from collections import OrderedDict
+        except ImportError:
+            from ucollections import OrderedDict
+        _OrderedDict = OrderedDict
+    return _OrderedDict
+
 _socket = None
 def _ensure_socket():
     global _socket
@@ -83,13 +96,46 @@ def _ensure_socket():
         _socket = socket
     return _socket
 
+_binascii = None
+def _ensure_binascii():
+    global _binascii
+    if _binascii is None:
+        try:
+            import binascii
+        except ImportError:
+            import ubinascii as binascii
+        _binascii = binascii
+    return _binascii
+
+_array = None
+def _ensure_array():
+    global _array
+    if _array is None:
+        try:
+            import array
+        except ImportError:
+            import uarray as array
+        _array = array
+    return _array
+
 __thread = None
 def _ensure_thread():
     global __thread
     if __thread is None:
         import _thread
         __thread = _thread
-    return _thread
+    return __thread
+
+_asyncio = None
+def _ensure_asyncio():
+    global _asyncio
+    if _asyncio is None:
+        try:
+            import asyncio
+        except ImportError:
+            import uasyncio as asyncio
+        _asyncio = asyncio
+    return _asyncio
 
 _FONT5X7 = None
 
@@ -124,6 +170,373 @@ def _ensure_font():
         )
     return _FONT5X7
 
+_FONT3X5 = None
+def _ensure_font3x5():
+    """3x5 capitals, digits and punctuation (space to _), 3 bytes per glyph."""
+    global _FONT3X5
+    if _FONT3X5 is None:
+        _FONT3X5 = (
+            b"\x00\x00\x00" b"\x00\x17\x00" b"\x03\x00\x03" b"\x1F\x0A\x1F" b"\x12\x1F\x09" b"\x09\x04\x12" b"\x0A\x15\x1A" b"\x00\x03\x00"
+            b"\x00\x0E\x11" b"\x11\x0E\x00" b"\x0A\x04\x0A" b"\x04\x0E\x04" b"\x10\x08\x00" b"\x04\x04\x04" b"\x00\x10\x00" b"\x18\x04\x03"
+            b"\x1F\x11\x1F" b"\x12\x1F\x10" b"\x1D\x15\x17" b"\x11\x15\x1F" b"\x07\x04\x1F" b"\x17\x15\x1D" b"\x1F\x15\x1D" b"\x01\x19\x07"
+            b"\x1F\x15\x1F" b"\x17\x15\x1F" b"\x00\x0A\x00" b"\x10\x0A\x00" b"\x04\x0A\x11" b"\x0A\x0A\x0A" b"\x11\x0A\x04" b"\x01\x15\x07"
+            b"\x0F\x11\x17" b"\x1E\x05\x1E" b"\x1F\x15\x0A" b"\x0E\x11\x11" b"\x1F\x11\x0E" b"\x1F\x15\x11" b"\x1F\x05\x01" b"\x0E\x11\x1D"
+            b"\x1F\x04\x1F" b"\x11\x1F\x11" b"\x08\x10\x0F" b"\x1F\x04\x1B" b"\x1F\x10\x10" b"\x1F\x06\x1F" b"\x1F\x01\x1E" b"\x0E\x11\x0E"
+            b"\x1F\x05\x02" b"\x0E\x19\x16" b"\x1F\x05\x1A" b"\x12\x15\x09" b"\x01\x1F\x01" b"\x1F\x10\x1F" b"\x0F\x10\x0F" b"\x1F\x0C\x1F"
+            b"\x1B\x04\x1B" b"\x03\x1C\x03" b"\x19\x15\x13" b"\x1F\x11\x00" b"\x03\x04\x18" b"\x00\x11\x1F" b"\x02\x01\x02" b"\x10\x10\x10"
+        )
+    return _FONT3X5
+
+# ---------------------------------------------------------------------------
+# Fonts — packed glyph tables, looked up by name, built on first use
+# ---------------------------------------------------------------------------
+class Font:
+    """
+    A bitmap font up to 8 pixels tall, packed MONO_VLSB: one byte per
+    column with the top pixel in bit 0, w bytes per glyph from chr(first)
+    on. spacing blank columns follow each glyph. proportional=True trims
+    the blank columns around each glyph (a space is space_w wide);
+    upper=True draws lower-case letters as capitals.
+    """
+    def __init__(self, data, w, h, first=32, spacing=0, proportional=False, space_w=None, upper=False):
+        # FrameBuffer needs a writable buffer: glyphs are views into this copy
+        self.data = data if isinstance(data, bytearray) else bytearray(data)
+        self.w = w
+        self.h = h
+        self.first = first
+        self.count = len(self.data) // w
+        self.spacing = spacing
+        self.upper = upper
+        self._glyphs = [None] * self.count
+        # Proportional: where each glyph starts in data and how wide it is
+        self.offsets = None
+        self.widths = None
+        if proportional:
+            self.offsets = [0] * self.count
+            self.widths = bytearray(self.count)
+            data = self.data
+            for i in range(self.count):
+                o = i * w
+                lo = 0
+                hi = w
+                while lo < hi and not data[o + lo]:
+                    lo += 1
+                while hi > lo and not data[o + hi - 1]:
+                    hi -= 1
+                if lo == hi:  # blank
+                    lo, hi = 0, (w + 1) // 2 if space_w is None else space_w
+                self.offsets[i] = o + lo
+                self.widths[i] = hi - lo
+
+    def _index(self, ch):
+        c = ord(ch)
+        if self.upper and 97 <= c <= 122:
+            c -= 32
+        c -= self.first
+        return c if 0 <= c < self.count else -1
+
+    def advance(self, ch):
+        """Pixels from this character to the next one."""
+        i = self._index(ch)
+        if self.widths is None or i < 0:
+            return self.w + self.spacing
+        return self.widths[i] + self.spacing
+
+    def width(self, s):
+        """Width of s in pixels, without the spacing after the last glyph."""
+        if not s:
+            return 0
+        if self.widths is None:
+            return len(s) * (self.w + self.spacing) - self.spacing
+        n = 0
+        for ch in s:
+            n += self.advance(ch)
+        return n - self.spacing
+
+    def glyph(self, ch):
+        """FrameBuffer over the glyph's columns, or None if the font lacks ch."""
+        i = self._index(ch)
+        if i < 0:
+            return None
+        g = self._glyphs[i]
+        if g is None:
+            framebuf = _ensure_framebuf()
+            if self.widths is None:
+                o, n = i * self.w, self.w
+            else:
+                o, n = self.offsets[i], self.widths[i]
+            g = framebuf.FrameBuffer(memoryview(self.data)[o:o + n], n, self.h, framebuf.MONO_VLSB)
+            self._glyphs[i] = g
+        return g
+
+    def strip(self, s):
+        """
+        Render s into its own FrameBuffer by copying font columns. None if
+        s has characters the font lacks (those leave the background alone,
+        which a strip can't do).
+        """
+        n = self.width(s)
+        buf = bytearray(n)
+        mv = memoryview(self.data)
+        x = 0
+        for ch in s:
+            i = self._index(ch)
+            if i < 0:
+                return None
+            if self.widths is None:
+                o, w = i * self.w, self.w
+            else:
+                o, w = self.offsets[i], self.widths[i]
+            end = min(x + w, n)
+            buf[x:end] = mv[o:o + end - x]
+            x += w + self.spacing
+        framebuf = _ensure_framebuf()
+        return framebuf.FrameBuffer(buf, n, self.h, framebuf.MONO_VLSB)
+
+def _make_font8x8():
+    """framebuf's built-in 8x8 font drawn twice, one pixel apart (bold)."""
+    framebuf = _ensure_framebuf()
+    data = bytearray(95 * 8)
+    for i in range(95):
+        fb = framebuf.FrameBuffer(memoryview(data)[i * 8:i * 8 + 8], 8, 8, framebuf.MONO_VLSB)
+        ch = chr(32 + i)
+        fb.text(ch, 0, 0, 1)
+        fb.text(ch, 1, 0, 1)
+    return Font(data, 8, 8)
+
+_FONT_MAKERS = {
+    "3x5": lambda: Font(_ensure_font3x5(), 3, 5, spacing=1, upper=True),
+    "5x7": lambda: Font(_ensure_font(), 5, 7),
+    "5x7p": lambda: Font(_ensure_font(), 5, 7, spacing=1, proportional=True, space_w=3),
+    "8x8": _make_font8x8,
+}
+_FONTS = {}
+_measured = {}
+
+def get_font(name="5x7"):
+    """The Font registered as name: "3x5", "5x7", "5x7p" (proportional) or "8x8" (bold)."""
+    f = _FONTS.get(name)
+    if f is None:
+        make = _FONT_MAKERS.get(name)
+        if make is None:
+            raise ValueError("unknown font %r" % (name,))
+        f = make()
+        _FONTS[name] = f
+    return f
+
+def register_font(name, font):
+    """Make a Font available to small_text(..., font=name) and measure()."""
+    _FONTS[name] = font
+    _measured.clear()
+
+def measure(text, font="5x7"):
+    """
+    Width in pixels of text as small_text() draws it in font. Answers are
+    remembered, so layouts can call it every frame.
+    """
+    key = (text, font)
+    w = _measured.get(key)
+    if w is None:
+        if len(_measured) >= 64:
+            _measured.clear()
+        w = get_font(font).width(text)
+        _measured[key] = w
+    return w
+
+def _ensure_glyph(ch):
+    """5x7 glyph FrameBuffer for ch, or None."""
+    return get_font("5x7").glyph(ch)
+
+class _TextCache:
+    """
+    LRU of rendered text strips: (text, font) -> FrameBuffer, so a label that
+    is drawn every frame costs one blit. Bounded by an approximate heap
+    budget: strip bytes plus ENTRY_OVERHEAD for the objects around them.
+    """
+    ENTRY_OVERHEAD = 64
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = _ensure_ordereddict()()
+
+    def get(self, key):
+        e = self._entries.pop(key, None)
+        if e is None:
+            self.misses += 1
+            return None
+        self._entries[key] = e  # re-insert = most recently used
+        self.hits += 1
+        return e[0]
+
+    def put(self, key, fb, nbytes):
+        nbytes += self.ENTRY_OVERHEAD
+        if nbytes > self.max_bytes:
+            return
+        entries = self._entries
+        while self.bytes + nbytes > self.max_bytes:
+            oldest = next(iter(entries))
+            self.bytes -= entries.pop(oldest)[1]
+            self.evictions += 1
+        entries[key] = (fb, nbytes)
+        self.bytes += nbytes
+
+    def clear(self):
+        self._entries = _ensure_ordereddict()()
+        self.bytes = 0
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+def _art_hash(data):
+    """32-bit hash of bytes: crc32 when the port has it, else FNV-1a."""
+    try:
+        return _ensure_binascii().crc32(data) & 0xFFFFFFFF
+    except (ImportError, AttributeError):
+        h = 0x811C9DC5
+        for b in data:
+            h = ((h ^ b) * 0x01000193) & 0xFFFFFFFF
+        return h
+
+def _image_key(s, target_w, target_h, scale_to_fit):
+    """13-char id of create_image(s, target_w, target_h, scale_to_fit) output."""
+    h = _art_hash(s.encode() if isinstance(s, str) else s)
+    return "%08x%02x%02x%d" % (h, target_w & 0xFF, target_h & 0xFF, 1 if scale_to_fit else 0)
+
+# Precompiled images from Tools/compile_assets.py: the generated assets.py
+# module (IMAGES = {name: (w, h, key, bytes)}) and/or images/<name>.bin files
+# (w, h, 13-byte key, then the MONO_VLSB bytes).
+ASSET_DIR = "images"
+_assets = None  # the assets module once imported, False if there is none
+def _ensure_assets():
+    global _assets
+    if _assets is None:
+        try:
+            import assets
+            _assets = assets
+        except ImportError:
+            _assets = False
+    return _assets
+
+def _load_asset(name):
+    """
+    (w, h, key, data) for a compiled image, or None. From the assets module
+    (imported once) data is a memoryview over its bytes constant, not a
+    copy; from a .bin file only that image is read into RAM.
+    """
+    m = _ensure_assets()
+    a = m.IMAGES.get(name) if m else None
+    if a is not None:
+        return a[0], a[1], a[2], memoryview(a[3])
+    try:
+        with open("%s/%s.bin" % (ASSET_DIR, name), "rb") as f:
+            hdr = f.read(15)
+            if len(hdr) != 15:
+                return None
+            w, h = hdr[0], hdr[1]
+            buf = bytearray(w * ((h + 7) // 8))
+            if f.readinto(buf) != len(buf):
+                return None
+            return w, h, hdr[2:].decode(), buf
+    except OSError:
+        return None
+
+def _asset_fb(data, w, h):
+    """FrameBuffer over asset data; copied only if this port wants a writable buffer."""
+    framebuf = _ensure_framebuf()
+    try:
+        return framebuf.FrameBuffer(data, w, h, framebuf.MONO_VLSB)
+    except (TypeError, ValueError):
+        return framebuf.FrameBuffer(bytearray(data), w, h, framebuf.MONO_VLSB)
+
+class _ImageCache:
+    """
+    Compiled ASCII art on flash: <dir>/[<name>.]<key>.bin holds the final
+    MONO_VLSB bytes. The key hashes the art and the create_image() options,
+    so edited art simply misses. Saving a named image deletes older versions
+    of that name; unnamed files are capped at max_files, the oldest going
+    first (one delete per new file, not the whole lot).
+    """
+
+    def __init__(self, dirname, max_files=32):
+        self.dirname = dirname
+        self.max_files = max_files
+        self.hits = 0
+        self.misses = 0
+        self._ready = False
+
+    def path(self, key, name=None):
+        if name:
+            return "%s/%s.%s.bin" % (self.dirname, name, key)
+        return "%s/%s.bin" % (self.dirname, key)
+
+    def load(self, path, buf, nbytes):
+        """Read nbytes into buf; False if missing or short."""
+        try:
+            with open(path, "rb") as f:
+                ok = f.readinto(memoryview(buf)[:nbytes]) == nbytes
+        except OSError:
+            ok = False
+        if ok:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return ok
+
+    def save(self, path, buf, nbytes, name=None):
+        os = _ensure_os()
+        try:
+            if not self._ready:
+                try:
+                    os.mkdir(self.dirname)
+                except OSError:
+                    pass  # already there
+                self._ready = True
+            self._prune(os, path[len(self.dirname) + 1:], name)
+            tmp = path + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(memoryview(buf)[:nbytes])
+            os.rename(tmp, path)
+        except OSError:
+            pass  # read-only or full flash: just render next time
+
+    def _prune(self, os, keep, name):
+        files = os.listdir(self.dirname)
+        tail = len(keep) - len(name) - 1 if name else len(keep)  # "<key>.bin"
+        if name:
+            old = [f for f in files if f[:-tail - 1] == name and f != keep]
+        else:
+            unnamed = [f for f in files if len(f) == tail and f != keep]
+            extra = len(unnamed) - self.max_files + 1
+            old = ()
+            if extra > 0:
+                # stat()[8] is the mtime: when the file was written
+                unnamed.sort(key=lambda f: os.stat(self.dirname + "/" + f)[8])
+                old = unnamed[:extra]
+        for f in old:
+            os.remove(self.dirname + "/" + f)
+
+    def clear(self):
+        os = _ensure_os()
+        try:
+            for f in os.listdir(self.dirname):
+                os.remove(self.dirname + "/" + f)
+        except OSError:
+            pass
+
+    def stats(self):
+        return {"dir": self.dirname, "hits": self.hits, "misses": self.misses}
+
 # Reusable buffers for ASCII → framebuffer conversion
 _FB_SRC = None
 _FB_SCALED = None
@@ -152,35 +565,722 @@ def _ensure_buffers(src_w, src_h, target_w, target_h):
 
     return _FB_SRC, _FB_SCALED, _FB_DST
 
+def _pack_ascii(lines, dst_w, dst_h, scale_to_fit, dst):
+    """
+    Nearest-neighbour scale ASCII art into the zeroed MONO_VLSB buffer dst
+    (dst_w x dst_h), centred, using only integer maths (the C3 has no FPU).
+
+    The scale is the ratio num/den of the limiting side, so source index
+    = dest index * den // num. Each destination column is packed into its
+    page bytes once per distinct source column pattern and copied.
+    """
+    src_w = max(len(ln) for ln in lines)
+    src_h = len(lines)
+    if not scale_to_fit:
+        num = den = 1
+    elif dst_w * src_h <= dst_h * src_w:
+        num, den = dst_w, src_w
+    else:
+        num, den = dst_h, src_h
+    new_w = max(1, src_w * num // den)
+    new_h = max(1, src_h * num // den)
+    ox = (dst_w - new_w) // 2
+    oy = (dst_h - new_h) // 2
+    pages = (dst_h + 7) // 8
+
+    # Source rows we actually sample, and for each one the bits it sets in
+    # the packed column: (row string, [(page, mask), ...])
+    rows = []
+    last = -1
+    for dy in range(max(0, oy), min(dst_h, oy + new_h)):
+        sy = min(src_h - 1, (dy - oy) * den // num)
+        if sy != last:
+            ln = lines[sy]
+            rows.append((ln + " " * (src_w - len(ln)), []))
+            last = sy
+        rows[-1][1].append((dy >> 3, 1 << (dy & 7)))
+
+    packed_cols = {}
+    for dx in range(max(0, ox), min(dst_w, ox + new_w)):
+        sx = min(src_w - 1, (dx - ox) * den // num)
+        key = "".join([r[0][sx] for r in rows])
+        packed = packed_cols.get(key)
+        if packed is None:
+            packed = bytearray(pages)
+            k = 0
+            for ch in key:
+                if ch != " ":
+                    for page, mask in rows[k][1]:
+                        packed[page] |= mask
+                k += 1
+            packed_cols[key] = packed
+        i = dx
+        for page in range(pages):
+            dst[i] = packed[page]
+            i += dst_w
+
+# ---------------------------------------------------------------------------
+# Background flush for SmallDisplay(double_buffer=True)
+# ---------------------------------------------------------------------------
+class _Flusher:
+    """
+    show() hands the finished frame to a _thread worker and returns straight
+    away, so the game can work on frame N+1 while frame N goes over I2C.
+
+    The frame and its dirty spans are copied into a second buffer; the draw
+    buffer keeps its contents, so apps that only redraw what changed still
+    work. Frames are numbered; flushed is the last one fully sent.
+
+    The worker sleeps on a lock until submit() hands it a frame, and _idle
+    is held while a frame is in flight, so neither side polls. stop()
+    ends the worker once its last frame is out.
+    """
+    def __init__(self, driver):
+        _thread = _ensure_thread()
+        self.driver = driver
+        self.buffer = bytearray(len(driver.buffer))
+        self._lo = bytearray(b"\xff" * driver.pages)
+        self._hi = bytearray(driver.pages)
+        self._start = 0
+        self.submitted = 0
+        self.flushed = 0
+        self.error = None
+        self.running = True
+        self._go = _thread.allocate_lock()    # released by submit(): a frame to send
+        self._go.acquire()
+        self._idle = _thread.allocate_lock()  # held from submit() until it is sent
+        _thread.start_new_thread(self._run, ())
+
+    def _run(self):
+        while True:
+            self._go.acquire()
+            if not self.running:
+                return
+            frame = self.submitted
+            try:
+                self.driver.flush(self.buffer, self._lo, self._hi, self._start)
+            except Exception as e:
+                self.error = e
+            self.flushed = frame
+            self._idle.release()
+
+    def submit(self):
+        """Wait for the previous frame, then queue the current one."""
+        self._idle.acquire()
+        self.buffer[:] = self.driver.buffer
+        self._start = self.driver.take_dirty(self._lo, self._hi)
+        self.submitted += 1
+        self._go.release()
+        return self.submitted
+
+    def wait(self, frame, timeout_ms=None):
+        if self.flushed >= frame or not self.running:
+            return True
+        if timeout_ms is None:
+            # _idle is free again once the frame in flight is sent
+            self._idle.acquire()
+            self._idle.release()
+            return True
+        start = time.ticks_ms()
+        while self.flushed < frame:
+            if time.ticks_diff(time.ticks_ms(), start) >= timeout_ms:
+                return False
+            time.sleep_ms(1)
+        return True
+
+    def stop(self):
+        """Let the frame in flight finish, then end the worker thread."""
+        if self.running:
+            self.wait(self.submitted)
+            self.running = False
+            self._go.release()
+
+class _FrameStats:
+    """
+    Rolling numbers for the last `history` frames shown, fed by
+    SmallDisplay.show(): time spent in show(), bytes sent, draw calls and the
+    time between frames. Counters are cumulative totals read from the driver.
+    """
+    OVERLAY_W = 26  # "99 99": fps and ms in show(), top-right corner
+
+    def __init__(self, history=16, target_fps=None):
+        self.history = history
+        self.target_fps = target_fps
+        self.overlay = False
+        self.frames = 0
+        self._i = 0
+        self._n = 0
+        self._last = None
+        self._bytes = None
+        self._draws = None
+        self.show_us = [0] * history
+        self.frame_us = [0] * history
+        self.nbytes = [0] * history
+        self.draws = [0] * history
+        self.under = bytearray(self.OVERLAY_W)  # window bytes below the overlay
+
+    def record(self, t0, show_us, bytes_total, draws_total, draws_after):
+        """draws_total: driver count when show() started; draws_after: when it ended."""
+        i = self._i
+        self.show_us[i] = show_us
+        self.frame_us[i] = 0 if self._last is None else time.ticks_diff(t0, self._last)
+        self.nbytes[i] = 0 if self._bytes is None else max(0, bytes_total - self._bytes)
+        self.draws[i] = 0 if self._draws is None else max(0, draws_total - self._draws)
+        self._last = t0
+        self._bytes = bytes_total
+        self._draws = draws_after
+        self._i = (i + 1) % self.history
+        if self._n < self.history:
+            self._n += 1
+        self.frames += 1
+
+    def overlay_text(self):
+        return "%2d %2d" % (min(self.fps(), 99), min(self.show_us[self._i - 1] // 1000, 99))
+
+    def fps(self):
+        total = sum(self.frame_us) if self._n == self.history else sum(self.frame_us[:self._n])
+        return 1000000 * self._n // total if total else 0
+
+    def stats(self):
+        n = self._n or 1
+        def avg(xs):
+            return sum(xs) // n
+        target = self.target_fps
+        late = 0
+        if target:
+            budget = 1000000 // target
+            late = sum(1 for us in self.frame_us if us > budget)
+        return {
+            "frames": self.frames,
+            "fps": self.fps(),
+            "target_fps": target,
+            "late": late,
+            "show_us": avg(self.show_us),
+            "worst_show_us": max(self.show_us),
+            "worst_frame_us": max(self.frame_us),
+            "bytes_per_flush": avg(self.nbytes),
+            "draw_calls": avg(self.draws),
+        }
+
+# ---------------------------------------------------------------------------
+# Console mirrors: SmallDisplay keeps the text it drew and, at each show(),
+# hands the screen's text (one string per text row) to mirror.screen(lines).
+# ---------------------------------------------------------------------------
+class MirrorRing:
+    """Keep the text of the last n screens; dump() prints them."""
+    def __init__(self, n=8):
+        self.n = n
+        self.screens = []
+
+    def screen(self, lines):
+        if self.screens and self.screens[-1] == lines:
+            return
+        self.screens.append(lines)
+        if len(self.screens) > self.n:
+            self.screens.pop(0)
+
+    def dump(self):
+        for lines in self.screens:
+            print("-" * 14)
+            for line in lines:
+                print(line)
+
+class MirrorPrint:
+    """
+    Print the screen's text, at most once every min_ms (the newest screen
+    wins). changes_only=True skips screens whose text was already printed.
+    uart: write to this machine.UART instead of print().
+    """
+    def __init__(self, min_ms=0, changes_only=False, uart=None):
+        self.min_ms = min_ms
+        self.changes_only = changes_only
+        self.uart = uart
+        self._last = None
+        self._t = None
+
+    def screen(self, lines):
+        if self.changes_only and lines == self._last:
+            return
+        now = time.ticks_ms()
+        if self.min_ms and self._t is not None and time.ticks_diff(now, self._t) < self.min_ms:
+            return
+        self._t = now
+        self._last = lines
+        text = "\n".join(lines)
+        if self.uart is not None:
+            self.uart.write(text + "\n")
+        else:
+            print(text)
+
+def _make_mirror(mirror):
+    if mirror == "changes":
+        return MirrorPrint(changes_only=True)
+    if mirror == "uart":
+        return MirrorPrint(min_ms=1000)
+    if mirror == "ring":
+        return MirrorRing()
+    if mirror == "print":
+        return MirrorPrint()
+    if mirror in (None, False, "off"):
+        return None
+    return mirror  # anything with a screen(lines) method
+
+# The panel is shared by every SmallDisplay in the process (the menu and the
+# app it launches): one driver and frame buffer, initialised once. Also the
+# bus clock it settled on and the background flusher using it, if any.
+_shared_driver = None
+_shared_freq = 0
+_shared_flusher = None
+
+def _stop_flusher():
+    """Stop the shared panel's background sender, if one runs."""
+    global _shared_flusher
+    f = _shared_flusher
+    _shared_flusher = None
+    if f is not None:
+        f.stop()
+
+# ---------------------------------------------------------------------------
+# Display power — dim, then switch the panel off while nothing happens
+# ---------------------------------------------------------------------------
+_power = None  # _DisplayPower of the shared panel, once set_power() is on
+
+class _DisplayPower:
+    """
+    ON -> DIM after dim_ms, -> OFF after off_ms without a button press, BLE
+    message or new picture. Nothing runs in the background: poll() (called
+    by idle_ms()) moves it along, touch() is activity and wakes the panel.
+    ms holds the time spent in each state, for battery estimates.
+    next_ms() says when poll() has something to do, for run().
+    """
+    ON, DIM, OFF = 0, 1, 2
+    NAMES = ("on", "dim", "off")
+
+    def __init__(self, driver, dim_ms, off_ms, dim_contrast):
+        self.driver = driver
+        self.dim_ms = dim_ms
+        self.off_ms = off_ms
+        self.dim_contrast = dim_contrast
+        self.contrast = driver.contrast_level  # the app's, put back on waking
+        self.state = self.ON
+        now = time.ticks_ms()
+        self.last = now    # last activity
+        self._since = now  # when the current state started
+        self.ms = [0, 0, 0]
+        self.wakes = 0
+        self._touch_cb = self.touch  # bound once: _activity() may run in an IRQ
+
+    def _enter(self, state, now):
+        if state == self.state:
+            return
+        f = _shared_flusher
+        if f is not None:
+            f.wait(f.submitted)  # not under a frame being sent
+        d = self.driver
+        if self.state == self.ON:
+            self.contrast = d.contrast_level  # it may have changed since set_power()
+        try:
+            if state == self.OFF:
+                d.poweroff()
+            else:
+                if self.state == self.OFF:
+                    d.poweron()
+                d.contrast(self.dim_contrast if state == self.DIM else self.contrast)
+        except OSError:
+            return  # try again at the next poll / touch
+        self.ms[self.state] += time.ticks_diff(now, self._since)
+        self._since = now
+        self.state = state
+
+    def poll(self):
+        now = time.ticks_ms()
+        idle = time.ticks_diff(now, self.last)
+        if self.state == self.ON and self.dim_ms is not None and idle >= self.dim_ms:
+            self._enter(self.DIM, now)
+        if self.state != self.OFF and self.off_ms is not None and idle >= self.off_ms:
+            self._enter(self.OFF, now)
+        return self.state
+
+    def next_ms(self):
+        """ms until poll() would change the state, None if it never will."""
+        idle = time.ticks_diff(time.ticks_ms(), self.last)
+        if self.state == self.ON and self.dim_ms is not None:
+            return max(0, self.dim_ms - idle)
+        if self.state != self.OFF and self.off_ms is not None:
+            return max(0, self.off_ms - idle)
+        return None
+
+    def touch(self, _=None):
+        now = time.ticks_ms()
+        self.last = now
+        if self.state != self.ON:
+            self.wakes += 1
+            self._enter(self.ON, now)
+
+    def stats(self):
+        ms = list(self.ms)
+        ms[self.state] += time.ticks_diff(time.ticks_ms(), self._since)
+        return {"state": self.NAMES[self.state], "on_ms": ms[0], "dim_ms": ms[1],
+                "off_ms": ms[2], "wakes": self.wakes}
+
+def _activity():
+    """
+    A button press or BLE message (may run in an IRQ): restart the idle
+    time and wake the panel, from the scheduler since that talks I2C.
+    Returns True if the panel was off.
+    """
+    p = _power
+    if p is None:
+        return False
+    p.last = time.ticks_ms()
+    was_off = p.state == p.OFF
+    if p.state == p.ON:
+        return False
+    if _SCHEDULE:
+        try:
+            _SCHEDULE(p._touch_cb, None)
+        except RuntimeError:
+            pass  # queue full: the next poll()/show() still sees it
+    else:
+        p.touch()
+    return was_off
+
+# ---------------------------------------------------------------------------
+# Light sleep — idle_ms() stops the CPU until the next deadline
+# ---------------------------------------------------------------------------
+_sleeper = None  # _LightSleep once set_light_sleep() is on
+_inputs = {}     # pin number -> Input handling it; its press wakes light sleep
+
+class _LightSleep:
+    """
+    wait(ms) is machine.lightsleep() up to ms, cut short for the next
+    SoftTimer, with the button pins armed to wake it. It waits awake
+    instead (50 ms at a time, so it looks again soon) while BLE is on, a
+    button is held down or its callbacks are queued, a frame is still
+    going out, or there is less than min_ms to sleep. The counters
+    give the time asleep / waiting awake, for residency.
+    """
+    REASONS = ("ble", "button", "display", "short")
+    AWAKE_MS = 50     # longest awake wait while something blocks sleep
+    NO_WAKE_MS = 50   # longest sleep when the pin can't wake the CPU
+
+    def __init__(self, min_ms):
+        import machine
+        self._machine = machine
+        self.min_ms = min_ms
+        self.wake_ok = True  # Pin.irq(wake=SLEEP) worked
+        self.asleep_ms = 0
+        self.awake_ms = 0    # in idle_ms(), kept awake by a REASON
+        self.sleeps = 0
+        self.button_wakes = 0
+        self.blocked = [0] * len(self.REASONS)
+        self._since = time.ticks_ms()
+
+    def _blocker(self):
+        """Index in REASONS of what keeps the CPU awake, or -1."""
+        if _ble_scanning or _ble_advertising:
+            return 0  # scanning/advertising stop in light sleep
+        for inp in _inputs.values():
+            if inp._pin.value() == inp._press_level or inp._dispatching:
+                # held down: the wake-up is on the level, a release can't end it
+                return 1
+        f = _shared_flusher
+        if f is not None and f.flushed < f.submitted:
+            return 2
+        return -1
+
+    def wait(self, ms):
+        start = time.ticks_ms()
+        why = self._blocker()
+        if why < 0:
+            svc = _timer_service
+            n = svc.next_ms() if svc is not None else None
+            if n is not None and n < ms:
+                ms = n
+            if ms < self.min_ms:
+                why = 3
+        if why >= 0:
+            self.blocked[why] += 1
+            time.sleep_ms(min(ms, self.AWAKE_MS))
+            self.awake_ms += time.ticks_diff(time.ticks_ms(), start)
+            return
+
+        machine = self._machine
+        armed = []
+        if self.wake_ok:
+            for inp in _inputs.values():
+                try:
+                    inp._arm_wake(machine)
+                    armed.append(inp)
+                except (ValueError, OSError):
+                    self.wake_ok = False  # this port can't: sleep in short steps
+        if not armed:
+            ms = min(ms, self.NO_WAKE_MS)
+        try:
+            machine.lightsleep(ms)
+        finally:
+            for inp in _inputs.values():
+                if inp._disarm_wake():
+                    self.button_wakes += 1
+        self.sleeps += 1
+        self.asleep_ms += time.ticks_diff(time.ticks_ms(), start)
+        svc = _timer_service
+        if svc is not None and svc._hw is not None:
+            svc._tick(None)  # its hardware timer stood still: catch up now
+
+    def stats(self):
+        total = time.ticks_diff(time.ticks_ms(), self._since) or 1
+        busy = max(0, total - self.asleep_ms - self.awake_ms)
+        st = {"asleep_ms": self.asleep_ms, "awake_ms": self.awake_ms, "busy_ms": busy,
+              "asleep_pct": 100 * self.asleep_ms // total,
+              "awake_pct": 100 * self.awake_ms // total,
+              "busy_pct": 100 * busy // total,
+              "sleeps": self.sleeps, "button_wakes": self.button_wakes,
+              "wake_ok": self.wake_ok}
+        for i, r in enumerate(self.REASONS):
+            st["blocked_" + r] = self.blocked[i]
+        return st
+
+def set_light_sleep(on=True, min_ms=20):
+    """
+    Let idle_ms() put the CPU in light sleep until the next thing is due
+    (the end of the wait, a SoftTimer, the display power manager); a
+    button press wakes it. Waits under min_ms stay awake.
+    """
+    global _sleeper
+    _sleeper = _LightSleep(min_ms) if on else None
+
+def sleep_stats():
+    """Time asleep / awake in idle_ms() / busy since set_light_sleep(), or None."""
+    s = _sleeper
+    return s.stats() if s is not None else None
+
+def idle_ms(ms):
+    """
+    time.sleep_ms(ms) for app loops that only wait for callbacks; also lets
+    the display power manager (SmallDisplay.set_power) dim or switch off
+    the screen when it is time, and with set_light_sleep() sleeps the CPU.
+    """
+    end = time.ticks_add(time.ticks_ms(), ms)
+    while True:
+        step = time.ticks_diff(end, time.ticks_ms())
+        p = _power
+        if p is not None:
+            p.poll()
+            n = p.next_ms()
+            if n is not None and n + 1 < step:
+                step = n + 1
+        if step <= 0:
+            return
+        s = _sleeper
+        if s is None:
+            time.sleep_ms(step)
+        else:
+            s.wait(step)
+
+# ---------------------------------------------------------------------------
+# asyncio runtime — awaitable button, BLE and frame events
+# - asyncio / uasyncio imported lazily, only by the async methods
+# - Input.event(), Bluetooth.recv(), SmallDisplay.next_frame() / menu_async()
+# - run(main) also drives the display power manager
+# ---------------------------------------------------------------------------
+def _new_flag():
+    """A flag an IRQ or scheduled callback can set and one task can wait on."""
+    asyncio = _ensure_asyncio()
+    f = getattr(asyncio, "ThreadSafeFlag", None)  # MicroPython
+    return f() if f is not None else asyncio.Event()
+
+def _clear_flag(flag):
+    """
+    Clear flag before looking at what it guards: a set() that comes after
+    that stays set, so the next _wait_flag() returns at once.
+    """
+    clear = getattr(flag, "clear", None)
+    if clear:
+        clear()
+
+async def _wait_flag(flag, timeout_ms=None):
+    """Wait for flag to be set; False on timeout (None = for ever)."""
+    asyncio = _ensure_asyncio()
+    try:
+        if timeout_ms is None:
+            await flag.wait()
+        else:
+            await asyncio.wait_for(flag.wait(), timeout_ms / 1000)
+    except asyncio.TimeoutError:
+        return False
+    return True
+
+async def _power_task():
+    """Steps the display power manager, sleeping until its next deadline."""
+    asyncio = _ensure_asyncio()
+    while True:
+        p = _power
+        ms = None
+        if p is not None:
+            p.poll()
+            ms = p.next_ms()
+        # Nothing due (no manager, or off): look again now and then, in
+        # case set_power() is called or a press wakes the panel
+        await asyncio.sleep((1000 if ms is None else ms + 1) / 1000)
+
+def run(main, *tasks):
+    """
+    Run coroutine main on the asyncio event loop until it returns (and
+    return its result). tasks are more coroutines that run next to it and
+    are cancelled when it ends. The loop sleeps until the next thing is
+    due: a button event, BLE message, next_frame() or sleep.
+    """
+    asyncio = _ensure_asyncio()
+
+    async def _main():
+        bg = [asyncio.create_task(t) for t in tasks]
+        bg.append(asyncio.create_task(_power_task()))
+        try:
+            return await main
+        finally:
+            for t in bg:
+                t.cancel()
+
+    return asyncio.run(_main())
+
 # ---------------------------------------------------------------------------
 # SmallDisplay — 72x40 window on SH1106 128x64 (col_offset=28, y_offset=24)
 # ---------------------------------------------------------------------------
 class SmallDisplay:
     SCL, SDA, ADDR = 6, 5, 0x3C
+    COL_OFFSET, ROW_OFFSET = 28, 24  # where the 72x40 glass sits in SH1106 RAM
+    # Bus clocks to try, fastest first; a panel that NACKs drops to the next
+    I2C_FREQS = (1000000, 400000, 100000)
 
-    def __init__(self):
+    def __init__(self, window_only=True, freq=400000, double_buffer=False, mirror="changes", text_cache=2048,
+                 image_cache=None):
+        """
+        window_only=True keeps just the visible 72x40 area in RAM (360 bytes)
+        and only ever addresses RAM pages 3-7 / the 72 visible columns.
+        window_only=False keeps the original full 128x64 buffer.
+        If an earlier SmallDisplay already set the panel up the same way, its
+        driver and buffer are reused and the panel is not initialised again.
+        freq is the fastest I2C clock to use; see open_bus().
+        double_buffer=True sends frames in the background; see set_double_buffer().
+        mirror copies the screen's text to the console; see set_mirror().
+        text_cache is the heap budget (bytes) for cached text strips; 0 = off.
+        image_cache is a flash directory (e.g. "imgcache") to keep compiled
+        create_image() art in; None (default) = off.
+        """
+        global _shared_driver, _shared_freq
         SH1106_I2C = _ensure_sh1106()
-        try:
-            self.hard_reset()
-        except Exception:
-            pass
-        try:
-            i2c = self.new_i2c()
-            self.driver = SH1106_I2C(128, 64, i2c, addr=self.ADDR, col_offset=28)
-        except Exception:
-            self.driver = None
+        self.width, self.height = 72, 40
+        self.freq = freq
+        self.mirror = _make_mirror(mirror)
+        self._text = {}  # (y, x) -> text drawn there, kept while mirror is on
+        self.text_cache = _TextCache(text_cache) if text_cache else None
+        self.image_cache = _ImageCache(image_cache) if image_cache else None
+        self.driver = None
+        self._flusher = None
+        shared = _shared_driver
+        if shared is not None and shared.width == (self.width if window_only else 128):
+            self._adopt(shared)
+        else:
+            try:
+                self.hard_reset()
+            except Exception:
+                pass
+            try:
+                i2c = self.open_bus()
+                if window_only:
+                    self.driver = SH1106_I2C(self.width, self.height, i2c, addr=self.ADDR,
+                                             col_offset=self.COL_OFFSET,
+                                             page_offset=self.ROW_OFFSET // 8, panel_height=64)
+                else:
+                    self.driver = SH1106_I2C(128, 64, i2c, addr=self.ADDR, col_offset=self.COL_OFFSET)
+                _shared_driver = self.driver
+                _shared_freq = self.freq
+            except Exception:
+                self.driver = None
 
         self.x_offset = 0
-        self.y_offset = 24
-        self.width, self.height = 72, 40
+        self.y_offset = 0 if window_only else self.ROW_OFFSET
+        self._win = self._window_fb(self.driver.buffer, self.driver.framebuf) if self.driver else None
+        # What display_lines() left on screen: first line index and
+        # (text, highlighted) per row; None = unknown, repaint everything.
+        # Only trusted while no frame was sent (by any SmallDisplay sharing
+        # the driver) and nothing was drawn since: driver.frames.
+        self._lines_top = 0
+        self._lines_rows = None
+        self._lines_frame = -1
+        self._stats = None
+        self._dl = None       # retained mode: this frame's draw calls
+        self._dl_prev = None  # ... and the last frame's
         self.fill(0)
         self._refresh_menu = False
+        self._refresh_flag = None  # set by refresh_menu() while menu_async() runs
+        self._frame_due = None     # next_frame(): when the next frame is due
+        self._frame_prev = None    # ... and when the last one was
+        if double_buffer:
+            self.set_double_buffer(True)
+
+    def _adopt(self, driver):
+        """Take over the shared driver from an earlier SmallDisplay."""
+        # its frames go to the same panel: let the last one finish, then
+        # stop its thread (that display falls back to plain show())
+        _stop_flusher()
+        self.driver = driver
+        if self.freq < _shared_freq:
+            driver.i2c = self.open_bus()
+        else:
+            self.freq = _shared_freq
 
-    def new_i2c(self):
+    def new_i2c(self, freq=100000):
         I2C = _ensure_i2c()
-        return I2C (0, scl=Pin(self.SCL), sda=Pin(self.SDA), freq=100000)
+        return I2C (0, scl=Pin(self.SCL), sda=Pin(self.SDA), freq=freq)
+
+    def open_bus(self, max_freq=None):
+        """
+        Open the bus at the fastest clock in I2C_FREQS (up to max_freq, default
+        self.freq) that the panel ACKs, and remember it in self.freq.
+        """
+        if max_freq is None:
+            max_freq = self.freq
+        for f in self.I2C_FREQS:
+            if f > max_freq:
+                continue
+            i2c = self.new_i2c(f)
+            try:
+                i2c.writeto(self.ADDR, b'\x80\xe3')  # NOP
+            except OSError:
+                continue
+            self._set_freq(f)
+            return i2c
+        self._set_freq(self.I2C_FREQS[-1])
+        return self.new_i2c(self.freq)
+
+    def _set_freq(self, f):
+        global _shared_freq
+        self.freq = f
+        if self.driver is not None and self.driver is _shared_driver:
+            _shared_freq = f
+
+    def _slow_down(self):
+        """Drop to the next slower bus clock after a NACK. False if none left."""
+        slower = [f for f in self.I2C_FREQS if f < self.freq]
+        if not slower:
+            return False
+        self.driver.i2c = self.open_bus(slower[0])
+        self.driver.invalidate()
+        return True
+
+    def hard_reset(self, force=False):
+        """
+        Unstick the bus and re-initialise the panel. Once the shared panel
+        is up (an earlier SmallDisplay did this) it is skipped unless
+        force=True, so apps can keep calling it at start-up for free.
+        """
+        if not force and self.driver is not None and self.driver is _shared_driver:
+            return
+        # Don't bit-bang the bus under a frame that is still being sent
+        self.wait_flushed()
 
-    def hard_reset(self):
         def reset_pins():
             scl = Pin(self.SCL, Pin.OUT, value=1)
             sda = Pin(self.SDA, Pin.IN)
@@ -198,77 +1298,579 @@ class SmallDisplay:
                   0xDA,0x12, 0xD5,0x80, 0xD9,0xF1, 0xDB,0x40, 0x8D,0x14, 0xA6, 0xAF):
             cmd(c)
 
+        # Panel RAM may not match our buffer any more (and the start line is
+        # back at 0); resend it all on next show(), at the clock open_bus()
+        # settles on
+        driver = self.driver
+        if driver:
+            driver.i2c = self.open_bus()
+            driver.start_page = 0
+            driver.invalidate()
+        p = _power
+        if p is not None:
+            p.touch()
+
     # --- primitives bounded to 72x40
+    # Every primitive draws through _win, a FrameBuffer over just the 72x40
+    # window (the driver's own when window_only), so the C code clips to
+    # what is visible. Shapes entirely off the window are dropped before
+    # any work, and the dirty box is trimmed to the window.
+    def _window_fb(self, buf, fb):
+        """fb over buf, or a view of its window when buf is the full panel."""
+        d = self.driver
+        if d.width == self.width and d.height == self.height:
+            return fb
+        framebuf = _ensure_framebuf()
+        o = (self.y_offset >> 3) * d.width + self.x_offset
+        return framebuf.FrameBuffer(memoryview(buf)[o:], self.width, self.height, framebuf.MONO_VLSB, d.width)
+
+    def _visible(self, x0, y0, x1, y1):
+        return x0 < self.width and y0 < self.height and x1 >= 0 and y1 >= 0 and x0 <= x1 and y0 <= y1
+
+    def _mark_window(self, x0, y0, x1, y1):
+        """Mark a window-space box dirty, trimmed to the window."""
+        if x0 < 0: x0 = 0
+        if y0 < 0: y0 = 0
+        if x1 >= self.width: x1 = self.width - 1
+        if y1 >= self.height: y1 = self.height - 1
+        self.driver.mark_dirty(x0 + self.x_offset, y0 + self.y_offset, x1 - x0 + 1, y1 - y0 + 1)
+
     def fill(self, c):
+        if self.mirror is not None:
+            self._text.clear()
+        if self._dl is not None:
+            self._dl.append(("fill", c))
+            return
         if self.driver:
-            self.driver.framebuf.fill_rect(self.x_offset, self.y_offset, self.width, self.height, c)
+            self._win.fill(c)
+            self._mark_window(0, 0, self.width - 1, self.height - 1)
 
     def pixel(self, x, y, c):
-        if self.driver and 0 <= x < self.width and 0 <= y < self.height:
-            self.driver.pixel(x + self.x_offset, y + self.y_offset, c)
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return
+        if self._dl is not None:
+            self._dl.append(("pixel", x, y, c))
+            return
+        if self.driver:
+            self._win.pixel(x, y, c)
+            self.driver.mark_dirty(x + self.x_offset, y + self.y_offset, 1, 1)
 
     def rect(self, x, y, w, h, c):
+        if not self._visible(x, y, x + w - 1, y + h - 1):
+            return
+        if self._dl is not None:
+            self._dl.append(("rect", x, y, w, h, c))
+            return
         if self.driver:
-            self.driver.rect(x + self.x_offset, y + self.y_offset, w, h, c)
+            self._win.rect(x, y, w, h, c)
+            self._mark_window(x, y, x + w - 1, y + h - 1)
 
     def fill_rect(self, x, y, w, h, c):
+        if not self._visible(x, y, x + w - 1, y + h - 1):
+            return
+        if self.mirror is not None:
+            self._forget_text(x, y, w, h)
+        if self._dl is not None:
+            self._dl.append(("fill_rect", x, y, w, h, c))
+            return
         if self.driver:
-            self.driver.fill_rect(x + self.x_offset, y + self.y_offset, w, h, c)
+            self._win.fill_rect(x, y, w, h, c)
+            self._mark_window(x, y, x + w - 1, y + h - 1)
 
     def hline(self, x, y, w, c=1):
+        if not self._visible(x, y, x + w - 1, y):
+            return
+        if self._dl is not None:
+            self._dl.append(("hline", x, y, w, c))
+            return
         if self.driver:
-            self.driver.hline(x + self.x_offset, y + self.y_offset, w, c)
+            self._win.hline(x, y, w, c)
+            self._mark_window(x, y, x + w - 1, y)
 
     def vline(self, x, y, h, c=1):
+        if not self._visible(x, y, x, y + h - 1):
+            return
+        if self._dl is not None:
+            self._dl.append(("vline", x, y, h, c))
+            return
         if self.driver:
-            self.driver.vline(x + self.x_offset, y + self.y_offset, h, c)
+            self._win.vline(x, y, h, c)
+            self._mark_window(x, y, x, y + h - 1)
 
     def line(self, x0, y0, x1, y1, c=1):
+        lx, hx = (x0, x1) if x0 <= x1 else (x1, x0)
+        ly, hy = (y0, y1) if y0 <= y1 else (y1, y0)
+        if not self._visible(lx, ly, hx, hy):
+            return
+        if self._dl is not None:
+            self._dl.append(("line", x0, y0, x1, y1, c))
+            return
         if self.driver:
-            x0 += self.x_offset; y0 += self.y_offset
-            x1 += self.x_offset; y1 += self.y_offset
-            self.driver.line(x0, y0, x1, y1, c)
+            self._win.line(x0, y0, x1, y1, c)
+            self._mark_window(lx, ly, hx, hy)
 
     def image(self, fbuf, x=0, y=0, key=-1, palette=None):
+        # FrameBuffer does not expose its size: only the right/bottom can be rejected
+        if x >= self.width or y >= self.height:
+            return
+        if self._dl is not None:
+            self._dl.append(("image", fbuf, x, y, key, palette))
+            return
         if self.driver:
-            self.driver.blit(fbuf, x + self.x_offset, y + self.y_offset, key, palette)
+            self._win.blit(fbuf, x, y, key, palette)
+            self._mark_window(x, y, self.width - 1, self.height - 1)
+
+    def blit(self, fbuf, x, y, w, h, key=-1, palette=None):
+        """Like image(), for a fbuf known to be w x h: only that box is sent."""
+        if not self._visible(x, y, x + w - 1, y + h - 1):
+            return
+        if self._dl is not None:
+            self._dl.append(("blit", fbuf, x, y, w, h, key, palette))
+            return
+        if self.driver:
+            self._win.blit(fbuf, x, y, key, palette)
+            self._mark_window(x, y, x + w - 1, y + h - 1)
 
     def scroll(self, x, y):
+        """
+        Shift the picture by x, y pixels. Vertical moves by whole rows of text
+        (multiples of 8) use the panel's start line, so the next show() only
+        sends the rows that scrolled in.
+        """
+        if self._dl is not None:
+            raise ValueError("scroll() is not available in retained mode")
+        if self.mirror is not None:
+            moved = {}
+            for (ty, tx), t in self._text.items():
+                if 0 <= ty + y < self.height and 0 <= tx + x < self.width:
+                    moved[(ty + y, tx + x)] = t
+            self._text = moved
         if self.driver:
-            self.driver.scroll(x, y)
+            if x == 0 and y and not y & 7:
+                self.driver.scroll_pages(-y // 8)
+            else:
+                self.driver.scroll(x, y)
 
     def ellipse(self, x, y, xr, yr, color):
+        if not self._visible(x - xr, y - yr, x + xr, y + yr):
+            return
+        if self._dl is not None:
+            self._dl.append(("ellipse", x, y, xr, yr, color))
+            return
         if self.driver:
-            self.driver.ellipse(x + self.x_offset, y + self.y_offset, xr, yr, color)
+            self._win.ellipse(x, y, xr, yr, color)
+            self._mark_window(x - xr, y - yr, x + xr, y + yr)
 
     def show(self):
-        if self.driver:
+        """Send the frame. In double-buffer mode returns its frame number."""
+        if self.mirror is not None:
+            self.mirror.screen(self.screen_text())
+        if not self.driver:
+            return 0
+        d = self.driver
+        retained = self._dl is not None
+        if retained:
+            if self._dl_frame != d.frames:
+                self._dl_prev = None  # someone else drew on the panel
+            self._commit_list()
+        p = _power
+        if p is not None and d.is_dirty():
+            p.touch()  # a new picture: make sure it can be seen
+        st = self._stats
+        if st is None:
+            frame = self._show()
+        else:
+            t0 = time.ticks_us()
+            draws = d.draw_calls
+            if st.overlay:
+                self._draw_overlay(st)
+            frame = self._show()
+            if st.overlay:
+                self._restore_overlay(st)
+            st.record(t0, time.ticks_diff(time.ticks_us(), t0), d.bytes_sent, draws, d.draw_calls)
+        if retained:
+            self._dl_frame = d.frames
+        return frame
+
+    def _show(self):
+        f = self._flusher
+        if f and not f.running:
+            # a newer SmallDisplay took the panel over
+            f = self._flusher = None
+        if f:
+            f.wait(f.submitted)
+            if f.error is not None:
+                f.error = None
+                if not self._slow_down():
+                    raise OSError("display not responding")
+            return f.submit()
+        try:
             self.driver.show()
+        except OSError:
+            # NACK: retry the whole frame at a slower clock
+            if not self._slow_down():
+                raise
+            self.driver.show()
+        return 0
+
+    # --- console mirror
+    def set_mirror(self, mirror):
+        """
+        Choose where the screen's text goes at each show():
+        None/"off", "changes" (print when the text changed), "uart" (print at
+        most once a second), "ring" (keep the last 8 screens; see MirrorRing),
+        "print" (every frame), or a MirrorPrint / MirrorRing / own object with
+        a screen(lines) method. Returns the mirror object.
+        """
+        self.mirror = _make_mirror(mirror)
+        self._text.clear()
+        return self.mirror
+
+    def screen_text(self):
+        """The text on screen, top to bottom: one string per row of text."""
+        rows = {}
+        for key in sorted(self._text):
+            rows.setdefault(key[0], []).append(self._text[key])
+        return [" ".join(rows[y]) for y in sorted(rows)]
+
+    def _forget_text(self, x, y, w, h):
+        text = self._text
+        if text:
+            for key in [k for k in text if y <= k[0] < y + h and x <= k[1] < x + w]:
+                del text[key]
+
+    # --- retained mode
+    def set_retained(self, on=True):
+        """
+        on=True: drawing calls are recorded instead of drawn, and show()
+        compares the frame's list with the previous one. Only the page spans
+        touched by calls that were added or removed are drawn again (in a
+        scratch buffer) and sent, so an unchanged screen costs nothing.
+        Each frame is drawn from scratch: start it with fill(). Images are
+        compared by object, so don't change a FrameBuffer that is on screen.
+        """
+        if on and self._dl is None:
+            self._dl = []
+            self._dl_prev = None
+            self._dl_frame = -1
+            self._scratch = None
+        elif not on and self._dl is not None:
+            self._dl = None
+            self._dl_prev = None
+            self._scratch = None
+
+    def _item_box(self, item):
+        """Window-space box (x0, y0, x1, y1) a recorded call may touch."""
+        op = item[0]
+        if op == "fill":
+            return 0, 0, self.width - 1, self.height - 1
+        if op == "small_text":
+            name = item[4] if len(item) > 4 else "5x7"
+            return item[2], item[3], item[2] + measure(item[1], name) - 1, item[3] + get_font(name).h - 1
+        if op == "pixel":
+            return item[1], item[2], item[1], item[2]
+        if op == "rect" or op == "fill_rect":
+            return item[1], item[2], item[1] + item[3] - 1, item[2] + item[4] - 1
+        if op == "hline":
+            return item[1], item[2], item[1] + item[3] - 1, item[2]
+        if op == "vline":
+            return item[1], item[2], item[1], item[2] + item[3] - 1
+        if op == "line":
+            return min(item[1], item[3]), min(item[2], item[4]), max(item[1], item[3]), max(item[2], item[4])
+        if op == "ellipse":
+            return item[1] - item[3], item[2] - item[4], item[1] + item[3], item[2] + item[4]
+        if op == "blit":
+            return item[2], item[3], item[2] + item[4] - 1, item[3] + item[5] - 1
+        # image: size unknown, assume it reaches the bottom-right corner
+        return item[2], item[3], self.width - 1, self.height - 1
+
+    def _commit_list(self):
+        """Diff this frame's list against the last one and redraw the changes."""
+        new = self._dl
+        old = self._dl_prev
+        self._dl = []
+        self._dl_prev = new
+        pages = (self.height + 7) // 8
+        lo = bytearray(b"\xff" * pages)
+        hi = bytearray(pages)
+        if old is None:
+            changed = new
+            lo = bytearray(pages)
+            for p in range(pages):
+                hi[p] = self.width - 1
+        else:
+            old_set = set(old)
+            new_set = set(new)
+            if old == new:
+                return
+            kept_new = [it for it in new if it in old_set]
+            kept_old = [it for it in old if it in new_set]
+            if kept_new != kept_old:
+                # same calls in another order: overlaps may come out differently
+                changed = new
+                lo = bytearray(pages)
+                for p in range(pages):
+                    hi[p] = self.width - 1
+            else:
+                changed = [it for it in new if it not in old_set]
+                changed += [it for it in old if it not in new_set]
+                for it in changed:
+                    x0, y0, x1, y1 = self._item_box(it)
+                    if x0 < 0: x0 = 0
+                    if y0 < 0: y0 = 0
+                    if x1 >= self.width: x1 = self.width - 1
+                    if y1 >= self.height: y1 = self.height - 1
+                    if x0 > x1 or y0 > y1:
+                        continue
+                    for p in range(y0 >> 3, (y1 >> 3) + 1):
+                        if x0 < lo[p]: lo[p] = x0
+                        if x1 > hi[p]: hi[p] = x1
+        self._redraw_spans(new, lo, hi)
+
+    def _redraw_spans(self, items, lo, hi):
+        """Draw items into a scratch buffer and copy the lo/hi page spans over."""
+        d = self.driver
+        framebuf = _ensure_framebuf()
+        if self._scratch is None:
+            buf = bytearray(len(d.buffer))
+            fb = framebuf.FrameBuffer(buf, d.width, d.height, framebuf.MONO_VLSB)
+            self._scratch = (buf, fb, self._window_fb(buf, fb))
+        buf, fb, win = self._scratch
+        xo = self.x_offset
+        yo = self.y_offset
+        for p in range(len(lo)):
+            if lo[p] <= hi[p]:
+                fb.fill_rect(lo[p] + xo, p * 8 + yo, hi[p] - lo[p] + 1, 8, 0)
+
+        for it in items:
+            x0, y0, x1, y1 = self._item_box(it)
+            for p in range(max(0, y0 >> 3), min(len(lo) - 1, y1 >> 3) + 1):
+                if lo[p] <= hi[p] and x0 <= hi[p] and x1 >= lo[p]:
+                    self._draw_item(win, it)
+                    break
+
+        w = d.width
+        for p in range(len(lo)):
+            if lo[p] <= hi[p]:
+                i = (p + (yo >> 3)) * w + xo + lo[p]
+                n = hi[p] - lo[p] + 1
+                d.buffer[i:i + n] = buf[i:i + n]
+                d.mark_dirty(xo + lo[p], p * 8 + yo, n, 8)
+
+    def _draw_item(self, fb, it):
+        """Draw a recorded item onto fb (window coordinates), marking nothing."""
+        op = it[0]
+        if op == "small_text":
+            name = it[4] if len(it) > 4 else "5x7"
+            self._text_into(fb, it[1], it[2], it[3], name)
+        elif op == "image":
+            fb.blit(*it[1:])
+        elif op == "blit":
+            fb.blit(it[1], it[2], it[3], it[6], it[7])
+        else:
+            getattr(fb, op)(*it[1:])
+
+    # --- frame statistics
+    def set_stats(self, on=True, target_fps=None, overlay=None, history=16):
+        """
+        on=True starts collecting per-frame numbers in show() (see stats()).
+        target_fps is what the app aims for; frames slower than that count
+        as late. overlay=True draws "fps ms" in the top-right corner of each
+        frame sent (without touching the picture the app drew); None leaves
+        it as it is. Off by default: then show() only checks one attribute.
+        """
+        st = self._stats
+        if not on:
+            if st is not None and st.overlay:
+                self._overlay_off()
+            self._stats = None
+            return
+        if st is None or st.history != history:
+            st = _FrameStats(history, target_fps)
+            self._stats = st
+        if target_fps is not None:
+            st.target_fps = target_fps
+        if overlay is not None:
+            if st.overlay and not overlay:
+                self._overlay_off()
+            st.overlay = overlay
+
+    def stats(self):
+        """
+        Averages over the last frames: fps, show_us (time inside show()),
+        bytes_per_flush, draw_calls per frame, and worst_show_us /
+        worst_frame_us; late = frames slower than target_fps. None when
+        set_stats() is off.
+        """
+        st = self._stats
+        return st.stats() if st is not None else None
+
+    # --- power
+    def set_power(self, on=True, dim_ms=20000, off_ms=60000, dim_contrast=1):
+        """
+        on=True dims the screen (contrast dim_contrast) after dim_ms and
+        switches it off after off_ms without a button press, BLE message or
+        new picture; None skips that step. The next one wakes it (a press
+        that wakes a dark screen is not passed on to the app). Loops that
+        wait should call idle_ms() instead of time.sleep_ms() so it can
+        step. One setting for the panel, shared by every SmallDisplay.
+        """
+        global _power
+        p = _power
+        if not on:
+            if p is not None:
+                p.touch()
+            _power = None
+            return
+        if self.driver is None:
+            return
+        if p is None or p.driver is not self.driver:
+            p = _DisplayPower(self.driver, dim_ms, off_ms, dim_contrast)
+            _power = p
+        else:
+            p.dim_ms, p.off_ms, p.dim_contrast = dim_ms, off_ms, dim_contrast
+            p.touch()
+
+    def power_stats(self):
+        """
+        state ("on", "dim" or "off"), on_ms / dim_ms / off_ms spent in each
+        since set_power(), and wakes; None when set_power() is off.
+        """
+        p = _power
+        return p.stats() if p is not None else None
+
+    def _overlay_span(self):
+        """(buffer index, x, y) of the overlay box in driver coordinates."""
+        d = self.driver
+        x = self.x_offset + self.width - _FrameStats.OVERLAY_W
+        y = self.y_offset
+        return (y >> 3) * d.width + x, x, y
+
+    def _draw_overlay(self, st):
+        d = self.driver
+        i, x, y = self._overlay_span()
+        w = _FrameStats.OVERLAY_W
+        st.under[:] = d.buffer[i:i + w]
+        fb = d.framebuf
+        fb.fill_rect(x, y, w, 8, 0)
+        px = x + 1
+        for ch in st.overlay_text():
+            g = _ensure_glyph(ch)
+            if g is not None:
+                fb.blit(g, px, y)
+            px += 5
+        d.mark_dirty(x, y, w, 8)
+
+    def _restore_overlay(self, st):
+        # The panel keeps the overlay; the buffer gets the app's pixels back
+        # (the next show() draws the overlay again anyway)
+        i, _, _ = self._overlay_span()
+        self.driver.buffer[i:i + _FrameStats.OVERLAY_W] = st.under
+
+    def _overlay_off(self):
+        _, x, y = self._overlay_span()
+        self.driver.mark_dirty(x, y, _FrameStats.OVERLAY_W, 8)
+
+    # --- double buffering
+    def set_double_buffer(self, on=True):
+        """
+        on=True: show() copies the frame to a second 360-byte buffer and a
+        background thread sends it, so the next frame can be drawn meanwhile.
+        Falls back to normal show() if threads are not available.
+        on=False stops the thread, also one an earlier SmallDisplay left
+        running on the panel (main_menu does this when an app returns).
+        """
+        global _shared_flusher
+        if on and not self._flusher and self.driver:
+            try:
+                self._flusher = _Flusher(self.driver)
+            except Exception:
+                self._flusher = None
+            if self.driver is _shared_driver:
+                _shared_flusher = self._flusher
+        elif not on:
+            f = self._flusher
+            self._flusher = None
+            if f is not None and f is not _shared_flusher:
+                f.stop()
+            elif self.driver is not None and self.driver is _shared_driver:
+                _stop_flusher()
+        return self._flusher is not None
+
+    def wait_flushed(self, frame=None, timeout_ms=None):
+        """
+        Frame fence: wait until frame (default: the last one shown) has been
+        sent to the panel. Returns False on timeout.
+        """
+        f = getattr(self, "_flusher", None)
+        if not f:
+            return True
+        return f.wait(f.submitted if frame is None else frame, timeout_ms)
 
     # --- text (14 chars fit if we advance 5px/char; no extra spacing)
-    def small_text(self, s, x, y):
-        print(s)
+    def small_text(self, s, x, y, font=None):
+        """
+        Draw s with its top-left corner at x, y. font is a name from the
+        font registry (see get_font()); None is the 5x7 font.
+        """
+        name = font or "5x7"
+        f = get_font(name)
+        w = measure(s, name)
+        if not self._visible(x, y, x + w - 1, y + f.h - 1):
+            return
+        if self.mirror is not None:
+            self._text[(y, x)] = s
+        if self._dl is not None:
+            self._dl.append(("small_text", s, x, y) if font is None else ("small_text", s, x, y, font))
+            return
         if not self.driver:
             return
+        self._text_into(self._win, s, x, y, name, f, w)
+        self._mark_window(x, y, x + w - 1, y + f.h - 1)
+
+    def _text_into(self, fb, s, x, y, name, f=None, w=None):
+        if f is None:
+            f = get_font(name)
+            w = measure(s, name)
+        blit = fb.blit
+        cache = self.text_cache
+        if cache is not None:
+            key = (s, name)
+            strip = cache.get(key)
+            if strip is None:
+                strip = f.strip(s)
+                if strip is not None:
+                    cache.put(key, strip, w)
+            if strip is not None:
+                blit(strip, x, y)
+                return
+        # One blit per glyph from the font (opaque, like the cell it covers);
+        # glyphs off the window are skipped
+        sp = f.spacing
         px = x
         for ch in s:
-            g = self.glyph5x7(ch)
-            if g is None:
-                px += 5; continue
-            b0,b1,b2,b3,b4 = g[0], g[1], g[2], g[3], g[4]
-            for cx, byte in ((0,b0),(1,b1),(2,b2),(3,b3),(4,b4)):
-                yy = y; m = byte
-                for _ in range(7):
-                    self.pixel(px+cx, yy, m & 1)
-                    m >>= 1; yy += 1
-            px += 5  # EXACT 5px advance → 14 chars * 5 = 70px (fits in 72px)
-
-    def small_text_center(self, s, y=16, show=False, reset=False):
-        text_w = len(s) * 5  # 5px per char (no extra spacing)
-        x = max(0, (self.width - text_w) // 2)
+            n = f.advance(ch)
+            if px >= self.width:
+                break
+            if px + n > 0:
+                g = f.glyph(ch)
+                if g is not None:
+                    blit(g, px, y)
+                    if sp:
+                        fb.fill_rect(px + n - sp, y, sp, f.h, 0)
+            px += n  # 5x7: EXACT 5px advance → 14 chars * 5 = 70px (fits in 72px)
+
+    def cache_stats(self):
+        """Hit/miss/eviction counters and size of the text strip cache."""
+        if self.text_cache is None:
+            return None
+        return self.text_cache.stats()
+
+    def small_text_center(self, s, y=16, show=False, reset=False, font=None):
+        x = max(0, (self.width - measure(s, font or "5x7")) // 2)
         if reset:
             self.fill(0)
-        self.small_text(s, x, y)
+        self.small_text(s, x, y, font)
         if show:
             self.show()
 
@@ -279,23 +1881,77 @@ class SmallDisplay:
         time.sleep_ms(ms)
 
     def display_lines(self, lines, highlight=None):
-        page = 0
-        if highlight is not None:
-            page = highlight // 5      
-        start = page * 5
-        end = start + 5
-        self.fill(0)
-        y = 0
-        for i, line in enumerate(lines[start:end], start=start):
-            if self.driver:
-                if highlight is not None and i == highlight:
+        """
+        Show 5 of lines with a cursor bar on lines[highlight], scrolling one
+        line at a time to keep the highlight visible. Moving a few lines is
+        done with the start line (see scroll()), so only the rows that
+        changed or scrolled in are redrawn and sent; if just the highlight
+        moved, only the two cursor bars are.
+
+        The screen is assumed to still hold the last call's rows only if
+        nothing was drawn or shown since; otherwise everything is redrawn.
+        """
+        rows_n = self.height // 8
+        top = self._lines_top
+        if highlight is None:
+            top = 0
+        elif highlight < top:
+            top = highlight
+        elif highlight >= top + rows_n:
+            top = highlight - rows_n + 1
+        if top > len(lines) - rows_n:
+            top = max(0, len(lines) - rows_n)
+
+        rows = []
+        for i in range(top, top + rows_n):
+            if i < len(lines):
+                rows.append((lines[i][:14], i == highlight))
+            else:
+                rows.append(None)
+
+        shown = self._lines_rows
+        if (not self.driver or self._lines_frame != self.driver.frames
+                or self._dl is not None or self.driver.is_dirty()):
+            shown = None
+        if shown is not None and self.driver:
+            d = top - self._lines_top
+            if d and -rows_n < d < rows_n:
+                self.scroll(0, -8 * d)
+                shown = shown[d:] + [False] * d if d > 0 else [False] * -d + shown[:d]
+            elif d:
+                shown = None
+        if shown is None:
+            self.fill(0)
+            shown = [None] * rows_n
+        for i in range(rows_n):
+            row = rows[i]
+            old = shown[i]
+            if row == old or not self.driver:
+                continue
+            y = i * 8
+            if row is not None and old and row[0] == old[0]:
+                # same text, highlight moved: just the cursor bar
+                self.fill_rect(0, y, 2, 8, 1 if row[1] else 0)
+                continue
+            self.fill_rect(0, y, self.width, 8, 0)
+            if row is not None:
+                if row[1]:
                     # cursor bar on the highlighted line
                     self.fill_rect(0, y, 2, 8, 1)
-                self.small_text(line[:14], 4, y)
-            print(("> " if (highlight is not None and i == highlight) else "  ") + line)
-            y += 8
+                self.small_text(row[0], 4, y)
+        if self.mirror is not None:
+            # mark the highlighted row for the console
+            for i in range(rows_n):
+                if rows[i] is not None:
+                    self._text[(i * 8, 0)] = ">" if rows[i][1] else " "
+                else:
+                    self._text.pop((i * 8, 0), None)
+        self._lines_top = top
+        self._lines_rows = rows
         self.show()
-        
+        if self.driver:
+            self._lines_frame = self.driver.frames
+
     def menu(self, lines, btn):
         current = 0
         active = True
@@ -327,11 +1983,73 @@ class SmallDisplay:
             if self._refresh_menu:
                 self.display_lines(lines, highlight=current)
                 self._refresh_menu = False
-            time.sleep_ms(50)
+            idle_ms(50)
         return current
     
     def refresh_menu(self):
         self._refresh_menu = True
+        f = self._refresh_flag
+        if f is not None:
+            f.set()
+
+    async def menu_async(self, lines, btn):
+        """
+        menu() for asyncio apps: same buttons, but other tasks keep running
+        while it waits. Returns the chosen index.
+        """
+        asyncio = _ensure_asyncio()
+        saved = (btn.on_press, btn.on_click, btn.on_double_click, btn.on_long_click)
+        btn.on_press = btn.on_click = btn.on_double_click = btn.on_long_click = None
+        btn.clear()
+        current = 0
+        flag = self._refresh_flag = _new_flag()
+
+        async def refresher():
+            while True:
+                await _wait_flag(flag)
+                _clear_flag(flag)
+                self._refresh_menu = False
+                self.display_lines(lines, highlight=current)
+
+        task = asyncio.create_task(refresher())
+        self.display_lines(lines, highlight=current)
+        try:
+            while True:
+                kind, _ = await btn.event()
+                if kind == "double":
+                    return current
+                if kind == "click":
+                    current = (current + 1) % len(lines)
+                elif kind == "long":
+                    current = (current - 1) % len(lines)
+                else:
+                    continue
+                self.display_lines(lines, highlight=current)
+        finally:
+            task.cancel()
+            self._refresh_flag = None
+            btn.clear()
+            btn.on_press, btn.on_click, btn.on_double_click, btn.on_long_click = saved
+
+    async def next_frame(self, fps=30):
+        """
+        asyncio: sleep until the next frame is due at fps and return the ms
+        since the previous one. An app that falls more than a frame behind
+        starts again from now instead of rushing to catch up.
+        """
+        asyncio = _ensure_asyncio()
+        period = 1000 // fps
+        now = time.ticks_ms()
+        due = self._frame_due
+        if due is None or time.ticks_diff(now, due) > period:
+            due = now
+        wait = time.ticks_diff(due, now)
+        await asyncio.sleep(wait / 1000 if wait > 0 else 0)
+        now = time.ticks_ms()
+        prev = self._frame_prev
+        self._frame_prev = now
+        self._frame_due = time.ticks_add(due, period)
+        return period if prev is None else time.ticks_diff(now, prev)
 
     def display_message(self, lines, delay_ms=1500):
         """Utility to show 1–3 centered lines."""
@@ -354,21 +2072,75 @@ class SmallDisplay:
             return memoryview(font)[o:o+5]
         return None
 
-        # --- ASCII art to framebuffer 
-    def create_image(self, s, target_w=72, target_h=40, scale_to_fit=True, reusable=False):
+    # --- Precompiled images
+    def load_image(self, name):
+        """
+        FrameBuffer for an image compiled by Tools/compile_assets.py (from the
+        assets module or images/<name>.bin), or None if there is no such asset.
+        """
+        a = _load_asset(name)
+        if a is None:
+            return None
+        return _asset_fb(a[3], a[0], a[1])
+
+    # --- ASCII art to framebuffer
+    def create_image(self, s, target_w=72, target_h=40, scale_to_fit=True, reusable=False, exact=False,
+                     cache=True, name=None):
+        """
+        Turn ASCII art (space = off, anything else = on) into a target_w x
+        target_h MONO_VLSB FrameBuffer, scaled to fit and centred.
+
+        Scaling is nearest-neighbour with integer index tables, written a
+        whole column of bytes at a time. exact=True uses the original
+        float/pixel-by-pixel scaler instead (slow, never cached; kept for
+        comparison).
+
+        With cache=True and an image_cache directory set, the result is kept there and
+        later calls with the same art and options just read it back. name
+        (e.g. "pet.happy") lets a new version of the art replace the old file,
+        and picks up the compiled asset of that name if it was built from
+        this exact art (see load_image()).
+        """
         framebuf = _ensure_framebuf()
+        nbytes = target_w * ((target_h + 7) // 8)
+        ic = self.image_cache if cache and not exact else None
+        if name or ic is not None:
+            key = _image_key(s, target_w, target_h, scale_to_fit)
+        if name and not exact:
+            a = _load_asset(name)
+            if a is not None and a[2] == key:
+                return _asset_fb(a[3], target_w, target_h)
+        if ic is not None:
+            path = ic.path(key, name)
+            if reusable:
+                _, _, dst_buf = _ensure_buffers(1, 1, target_w, target_h)
+            else:
+                dst_buf = bytearray(nbytes)
+            if ic.load(path, dst_buf, nbytes):
+                return framebuf.FrameBuffer(dst_buf, target_w, target_h, framebuf.MONO_VLSB)
 
         # Clean input lines
         if s.startswith("\n"):
             s = s[1:]
         lines = [ln.rstrip("\n") for ln in s.splitlines()]
-        if not lines:
+        if lines and exact:
+            return self._create_image_exact(lines, target_w, target_h, scale_to_fit, reusable)
+
+        if ic is None:
             if reusable:
                 _, _, dst_buf = _ensure_buffers(1, 1, target_w, target_h)
             else:
-                dst_buf = bytearray(target_w * ((target_h + 7) // 8))
-            return framebuf.FrameBuffer(dst_buf, target_w, target_h, framebuf.MONO_VLSB)
+                dst_buf = bytearray(nbytes)
+        dst_fb = framebuf.FrameBuffer(dst_buf, target_w, target_h, framebuf.MONO_VLSB)
+        dst_fb.fill(0)
+        if lines:
+            _pack_ascii(lines, target_w, target_h, scale_to_fit, dst_buf)
+        if ic is not None:
+            ic.save(path, dst_buf, nbytes, name)
+        return dst_fb
 
+    def _create_image_exact(self, lines, target_w, target_h, scale_to_fit, reusable):
+        framebuf = _ensure_framebuf()
         src_w = max(len(ln) for ln in lines)
         src_h = len(lines)
 
@@ -629,10 +2401,273 @@ class Keyboard:
         self._refresh()
 
 # ---------------------------------------------------------------------------
-# Input — single-button with click/double/long; uses Timer(0)
+# TimerService — many software timers on one hardware Timer
+# ---------------------------------------------------------------------------
+class SoftTimer:
+    """
+    A one-shot or periodic timer on a TimerService. callback(timer) runs
+    from the service's tick (a scheduled callback, like machine.Timer's).
+    Make one and reuse it: start() and cancel() don't allocate.
+    """
+    def __init__(self, callback=None, service=None):
+        self.callback = callback
+        self.service = service or timer_service()
+        self.periodic = False
+        self._period = 0   # ticks, for periodic timers
+        self._due = 0      # service tick to fire at
+        self._slot = -1    # wheel slot, -1 = not running, -2 = due this tick
+        self._prev = None
+        self._next = None
+
+    def start(self, ms, periodic=False, callback=None):
+        """(Re)start: fire in ms milliseconds, and then every ms if periodic."""
+        if callback is not None:
+            self.callback = callback
+        self.periodic = periodic
+        self.service._start(self, ms)
+
+    def cancel(self):
+        if self._slot >= 0:
+            self.service._cancel(self)
+        elif self._slot == -2:
+            self._slot = -1  # unlinked by the tick already: just don't fire
+
+    def active(self):
+        return self._slot != -1
+
+
+class TimerService:
+    """
+    Hashed timing wheel: `slots` lists of timers, one per tick of tick_ms,
+    driven by one periodic hardware Timer(hw_id). A timer goes in the slot
+    of the tick it is due at (farther ones come round again until their
+    tick), so start() and cancel() are O(1) and a tick only looks at one
+    slot. The hardware timer only runs while a software timer does.
+    Use timer_service() for the shared one.
+    """
+    def __init__(self, hw_id=0, tick_ms=10, slots=64):
+        self.hw_id = hw_id
+        self.tick_ms = tick_ms
+        self._mask = slots - 1  # slots must be a power of two
+        self._slots = [None] * slots
+        self._now = 0           # ticks done
+        self._last = 0          # ticks_ms of the last tick
+        self._count = 0         # running timers
+        self._hw = None
+        self._busy = False      # a start/cancel is changing the lists
+        self._tick_cb = self._tick  # bound once: no allocation per tick
+        self.late_ticks = 0     # ticks that ran late (tick() caught up)
+
+    def call_later(self, ms, callback):
+        """A new SoftTimer that calls callback(timer) once, ms from now."""
+        t = SoftTimer(callback, self)
+        t.start(ms)
+        return t
+
+    def call_every(self, ms, callback):
+        """A new SoftTimer that calls callback(timer) every ms."""
+        t = SoftTimer(callback, self)
+        t.start(ms, periodic=True)
+        return t
+
+    def active(self):
+        return self._count
+
+    def next_ms(self):
+        """ms until the next timer is due, None if none is running."""
+        if self._count == 0:
+            return None
+        due = None
+        for t in self._slots:
+            while t is not None:
+                if due is None or t._due < due:
+                    due = t._due
+                t = t._next
+        ms = (due - self._now) * self.tick_ms - time.ticks_diff(time.ticks_ms(), self._last)
+        return ms if ms > 0 else 0
+
+    # --- wheel
+    def _link(self, t, due):
+        i = due & self._mask
+        t._due = due
+        t._slot = i
+        t._prev = None
+        head = self._slots[i]
+        t._next = head
+        if head is not None:
+            head._prev = t
+        self._slots[i] = t
+
+    def _unlink(self, t):
+        if t._prev is not None:
+            t._prev._next = t._next
+        else:
+            self._slots[t._slot] = t._next
+        if t._next is not None:
+            t._next._prev = t._prev
+        t._slot = -1
+        t._prev = t._next = None
+
+    def _start(self, t, ms):
+        self._busy = True
+        if self._hw is None:
+            self._last = time.ticks_ms()  # the wheel stood still until now
+        if t._slot >= 0:
+            self._unlink(t)
+        else:
+            self._count += 1
+        n = (ms + self.tick_ms - 1) // self.tick_ms
+        if n < 1:
+            n = 1
+        t._period = n
+        self._link(t, self._now + n)
+        self._busy = False
+        if self._hw is None:
+            self._hw = Timer(self.hw_id)
+            self._hw.init(mode=Timer.PERIODIC, period=self.tick_ms, callback=self._tick_cb)
+
+    def _cancel(self, t):
+        self._busy = True
+        self._unlink(t)
+        self._count -= 1
+        self._busy = False
+        if self._count == 0:
+            self._stop_hw()
+
+    def _stop_hw(self):
+        hw = self._hw
+        self._hw = None
+        if hw is not None:
+            try: hw.deinit()
+            except: pass
+
+    def _tick(self, _t):
+        if self._busy:
+            return  # in the middle of start()/cancel(); the next tick catches up
+        now = time.ticks_ms()
+        n = time.ticks_diff(now, self._last) // self.tick_ms
+        if n <= 0:
+            return
+        if n > 1:
+            self.late_ticks += n - 1
+        self._last = time.ticks_add(self._last, n * self.tick_ms)
+        end = self._now + n
+        slots = self._slots
+        mask = self._mask
+        # Unlink everything due into a chain first, so callbacks can start
+        # and cancel timers freely. Timers in the chain are marked -2; a
+        # callback that cancels or restarts one of them changes that, and
+        # then it doesn't fire here.
+        ready = None
+        for k in range(1, min(n, mask + 1) + 1):
+            t = slots[(self._now + k) & mask]
+            while t is not None:
+                nxt = t._next
+                if t._due <= end:
+                    self._unlink(t)
+                    self._count -= 1
+                    t._slot = -2
+                    t._next = ready
+                    ready = t
+                t = nxt
+        self._now = end
+        while ready is not None:
+            t = ready
+            ready = t._next
+            t._next = None
+            if t._slot != -2:
+                continue
+            t._slot = -1
+            if t.periodic:
+                due = t._due + t._period
+                if due <= end:
+                    due = end + 1
+                self._link(t, due)
+                self._count += 1
+            cb = t.callback
+            if cb is not None:
+                cb(t)
+        if self._count == 0:
+            self._stop_hw()
+
+_timer_service = None
+
+def timer_service():
+    """The TimerService on hardware Timer(0) that Input and Bluetooth share."""
+    global _timer_service
+    if _timer_service is None:
+        _timer_service = TimerService()
+    return _timer_service
+
+# ---------------------------------------------------------------------------
+# Input — single-button with click/double/long; uses a SoftTimer
 # ---------------------------------------------------------------------------
+class _Latency:
+    """
+    Log2 histograms in us, per Input event kind: 'queue' (edge to callback
+    start) and 'run' (the callback). Bin b counts values below 2**b, the
+    last one everything longer, so percentiles come out rounded up to a
+    power of two; the max is exact. record() doesn't allocate.
+    """
+    BINS = 21  # the last bin starts at ~0.5 s
+    QUEUE, RUN = 0, 1
+
+    def __init__(self, kinds=5):
+        array = _ensure_array()
+        self.hist = array.array("I", bytearray(4 * kinds * 2 * self.BINS))
+        self.max = array.array("I", bytearray(4 * kinds * 2))
+        self.n = array.array("I", bytearray(4 * kinds))
+
+    def _add(self, row, us):
+        if us < 0:
+            us = 0
+        if us > self.max[row]:
+            self.max[row] = us
+        b = 0
+        while us and b < self.BINS - 1:
+            us >>= 1
+            b += 1
+        self.hist[row * self.BINS + b] += 1
+
+    def record(self, kind, queue_us, run_us):
+        self.n[kind] += 1
+        self._add(kind * 2 + self.QUEUE, queue_us)
+        self._add(kind * 2 + self.RUN, run_us)
+
+    def percentile(self, kind, which, p):
+        """Upper bound (us) under which p % of the values fall; 0 if none."""
+        n = self.n[kind]
+        if n == 0:
+            return 0
+        want = (n * p + 99) // 100
+        base = (kind * 2 + which) * self.BINS
+        seen = 0
+        for b in range(self.BINS):
+            seen += self.hist[base + b]
+            if seen >= want:
+                return 1 << b
+        return 1 << (self.BINS - 1)
+
+    def stats(self, kind):
+        st = {"n": self.n[kind]}
+        for which, name in ((self.QUEUE, "queue"), (self.RUN, "run")):
+            for p in (50, 90, 99):
+                st["%s_p%d" % (name, p)] = self.percentile(kind, which, p)
+            st[name + "_max"] = self.max[kind * 2 + which]
+        return st
+
 class Input:
-    def __init__(self, pin_no=9, active_low=True, debounce_ms=80, long_ms=500, double_ms=500):
+    """
+    Every press / click / double / long is written, with its ticks_ms, into
+    a preallocated ring of `events` entries straight from the interrupt.
+    Read them with poll() / drain() / wait(), or set the on_* callbacks:
+    those run from one scheduled call per burst, so a busy
+    micropython.schedule queue only delays them.
+    """
+    PRESS, CLICK, DOUBLE, LONG = 1, 2, 3, 4
+    KINDS = (None, "press", "click", "double", "long")
+
+    def __init__(self, pin_no=9, active_low=True, debounce_ms=80, long_ms=500, double_ms=500, events=16):
         self.debounce_ms = debounce_ms
         self.long_ms = long_ms
         self.double_ms = double_ms
@@ -644,84 +2679,268 @@ class Input:
         self._pressed = False
         self._down_ms = 0
         self._click_pending = False
-        self._timer = None  # Timer(0) allocated on first use
+        self._timer = SoftTimer(self._timeout)  # double-click window, on the TimerService
+
+        # Event ring. _head counts events written; _tail those read by
+        # poll(), _ctail those passed to callbacks. Only the IRQ moves _head.
+        self._n = events
+        self._ev_kind = bytearray(events)
+        # bytearray, not bytes: MicroPython's array() only copies a bytearray as raw data
+        self._ev_ms = _ensure_array().array("i", bytearray(4 * events))
+        self._ev_us = _ensure_array().array("i", bytearray(4 * events))  # ticks_us of the edge
+        self._head = 0
+        self._tail = 0
+        self._ctail = 0
+        self._reader = False       # poll()/drain()/wait() used: keep unread events
+        self._dispatching = False  # a _dispatch() is scheduled
+        self._dispatch_cb = self._dispatch  # bound once: _push() runs in the IRQ
+        self._flag = None          # event(): set on every new event
+        self.overflows = 0         # events lost because the ring was full
+        self.late = 0              # schedule queue full: callbacks ran at the next event
+        self._up_us = 0            # ticks_us of the last release (a click's edge)
+        self._lat = None           # _Latency once set_latency() is on
 
         self.on_press = None   # fires immediately when button goes low, no debouncing or waiting for long click detection
         self.on_click = None
         self.on_double_click = None
         self.on_long_click = None
 
-        trig = Pin.IRQ_FALLING | Pin.IRQ_RISING
-        self._pin.irq(trigger=trig, handler=self._irq)
+        self._pin.irq(trigger=Pin.IRQ_FALLING | Pin.IRQ_RISING, handler=self._irq)
+        _inputs[pin_no] = self  # the newest Input on a pin has its IRQ
 
     def _irq(self, pin):
+        us = time.ticks_us()
         now = time.ticks_ms()
         val = self._pin.value()
         if val == self._press_level:  # press
             if time.ticks_diff(now, self._last_irq) < self.debounce_ms:
                 return
             self._last_irq = now
+            if _activity():
+                return  # the screen was off: this press only wakes it
             self._pressed = True
             self._down_ms = now
-            if self.on_press:
-                self._schedule(self._fire, 'press')
+            self._push(self.PRESS, now, us)
 
             if self._click_pending:
                 self._cancel_timer()
                 self._click_pending = False
                 self._pressed = False
-                self._schedule(self._fire, 'double')
+                self._push(self.DOUBLE, now, us)
         else:  # release
             if not self._pressed:
                 return
             self._pressed = False
+            self._up_us = us
             dur = time.ticks_diff(now, self._down_ms)
             if dur >= self.long_ms:
                 self._cancel_timer()
                 self._click_pending = False
-                self._schedule(self._fire, 'long')
+                self._push(self.LONG, now, us)
             else:
                 self._click_pending = True
                 self._start_timer()
 
     def _start_timer(self):
-        t = self._timer
-        if t is None:
-            t = Timer(0)  # only 0 and 1 exist; BLE uses 1
-            self._timer = t
-        def _timeout(_t):
-            if self._click_pending:
-                self._click_pending = False
-                self._schedule(self._fire, 'click')
-        t.init(mode=Timer.ONE_SHOT, period=self.double_ms, callback=_timeout)
+        self._timer.start(self.double_ms)
 
-    def _cancel_timer(self):
-        t = self._timer
-        if t is not None:
-            try: t.deinit()
-            except: pass
+    def _timeout(self, _t):
+        if self._click_pending:
+            self._click_pending = False
+            self._push(self.CLICK, time.ticks_ms(), self._up_us)
 
-    def _schedule(self, fn, arg):
-        if _SCHEDULE:
-            _SCHEDULE(fn, arg)
+    def _cancel_timer(self):
+        self._timer.cancel()
+
+    # --- light sleep (set_light_sleep): a press wakes the CPU
+    def _arm_wake(self, machine):
+        """Swap the edge IRQ for a level wake-up, just before lightsleep()."""
+        level = Pin.WAKE_LOW if self._press_level == 0 else Pin.WAKE_HIGH
+        self._pin.irq(trigger=level, wake=machine.SLEEP)
+
+    def _disarm_wake(self):
+        """Edge IRQ back; True if the button is down (that press is handled now)."""
+        self._pin.irq(trigger=Pin.IRQ_FALLING | Pin.IRQ_RISING, handler=self._irq)
+        if self._pin.value() == self._press_level:
+            self._irq(self._pin)  # it was up when we slept: the edge came while asleep
+            return True
+        return False
+
+    # --- event ring (written from the IRQ: no allocation here)
+    def _push(self, kind, now, us):
+        h = self._head
+        n = self._n
+        if h - self._ctail >= n:
+            self._ctail += 1  # callbacks that far behind lose the oldest
+        if h - self._tail >= n:
+            if self._reader:
+                self.overflows += 1
+                return
+            self._tail += 1   # nobody reads the ring: just keep the latest
+        i = h % n
+        self._ev_kind[i] = kind
+        self._ev_ms[i] = now
+        self._ev_us[i] = us
+        self._head = h + 1
+        if self._flag is not None:
+            self._flag.set()
+        if self.on_press or self.on_click or self.on_double_click or self.on_long_click:
+            if not self._dispatching:
+                self._dispatching = True
+                if _SCHEDULE:
+                    try:
+                        _SCHEDULE(self._dispatch_cb, None)
+                    except RuntimeError:
+                        self._dispatching = False
+                        self.late += 1
+                else:
+                    self._dispatch(None)
         else:
-            fn(arg)
+            self._ctail = h + 1
+
+    def _dispatch(self, _):
+        """Run the callbacks for every event not passed on yet."""
+        self._dispatching = False
+        while self._ctail != self._head:
+            i = self._ctail % self._n
+            self._ctail += 1
+            kind = self._ev_kind[i]
+            lat = self._lat
+            if lat is None:
+                self._fire(kind)
+            else:
+                edge = self._ev_us[i]
+                t0 = time.ticks_us()
+                if self._fire(kind):
+                    lat.record(kind, time.ticks_diff(t0, edge), time.ticks_diff(time.ticks_us(), t0))
 
     def _fire(self, kind):
-        if kind == 'press' and self.on_press: self.on_press()
-        elif kind == 'click' and self.on_click: self.on_click()
-        elif kind == 'double' and self.on_double_click: self.on_double_click()
-        elif kind == 'long' and self.on_long_click: self.on_long_click()
+        """Run kind's callback; False if it has none."""
+        if kind == self.PRESS and self.on_press: self.on_press()
+        elif kind == self.CLICK and self.on_click: self.on_click()
+        elif kind == self.DOUBLE and self.on_double_click: self.on_double_click()
+        elif kind == self.LONG and self.on_long_click: self.on_long_click()
+        else: return False
+        return True
+
+    # --- latency: from the edge to the callback, per kind
+    def set_latency(self, on=True):
+        """Start measuring callback latency (see latency()); False stops and forgets it."""
+        self._lat = _Latency() if on else None
+
+    def latency(self, kind=None):
+        """
+        Per kind with measured callbacks: {"n", "queue_p50", "queue_p90",
+        "queue_p99", "queue_max", "run_p50", ... "run_max"} in us. queue
+        is from the edge (the release, for click and long) to the callback
+        starting, run the callback itself. Only kind's dict if given; None
+        before set_latency().
+        """
+        lat = self._lat
+        if lat is None:
+            return None
+        if kind is not None:
+            return lat.stats(self.KINDS.index(kind))
+        out = {}
+        for k in range(1, len(self.KINDS)):
+            st = lat.stats(k)
+            if st["n"]:
+                out[self.KINDS[k]] = st
+        return out
+
+    def latency_dump(self):
+        """Print latency() as a table."""
+        lat = self._lat
+        if lat is None:
+            print("latency: off (set_latency())")
+            return
+        fmt = "%-6s %6s | %7s %7s %7s %7s | %7s %7s %7s %7s"
+        print(fmt % ("kind", "n", "queue50", "90", "99", "max", "run50", "90", "99", "max"))
+        for k in range(1, len(self.KINDS)):
+            st = lat.stats(k)
+            if st["n"]:
+                print(fmt % (self.KINDS[k], st["n"], st["queue_p50"], st["queue_p90"], st["queue_p99"],
+                             st["queue_max"], st["run_p50"], st["run_p90"], st["run_p99"], st["run_max"]))
+        print("us; percentiles rounded up to a power of 2. late %d, overflows %d" % (self.late, self.overflows))
+
+    # --- reading events instead of (or as well as) callbacks
+    def poll(self):
+        """
+        The oldest unread event as (kind, ticks_ms), or None. kind is
+        "press", "click", "double" or "long". Once an app reads events,
+        new ones are dropped (and counted in overflows) while 'events'
+        are waiting, instead of replacing the oldest.
+        """
+        self._reader = True
+        if self._ctail != self._head and not self._dispatching:
+            self._dispatch(None)  # callbacks whose schedule() failed
+        t = self._tail
+        if t == self._head:
+            return None
+        i = t % self._n
+        ev = (self.KINDS[self._ev_kind[i]], self._ev_ms[i])
+        self._tail = t + 1
+        return ev
+
+    def drain(self):
+        """Every unread event, oldest first, as a list of (kind, ticks_ms)."""
+        out = []
+        ev = self.poll()
+        while ev is not None:
+            out.append(ev)
+            ev = self.poll()
+        return out
+
+    def wait(self, timeout_ms=None):
+        """poll(), waiting up to timeout_ms (None = for ever) for an event."""
+        start = time.ticks_ms()
+        while True:
+            ev = self.poll()
+            if ev is not None:
+                return ev
+            if timeout_ms is not None and time.ticks_diff(time.ticks_ms(), start) >= timeout_ms:
+                return None
+            idle_ms(5)
+
+    async def event(self, timeout_ms=None):
+        """
+        asyncio: poll(), waiting up to timeout_ms (None = for ever) for an
+        event while other tasks run.
+        """
+        if self._flag is None:
+            self._flag = _new_flag()
+        while True:
+            _clear_flag(self._flag)
+            ev = self.poll()
+            if ev is not None:
+                return ev
+            if not await _wait_flag(self._flag, timeout_ms):
+                return None
+
+    def clear(self):
+        """
+        Forget unread events. Until the next poll() new ones replace the
+        oldest again, so a ring nobody reads any more never blocks.
+        """
+        self._tail = self._head
+        self._reader = False
+
+    def pending(self):
+        """How many events poll() would return now."""
+        return self._head - self._tail
 
 # ---------------------------------------------------------------------------
 # Bluetooth — simple advertiser/scanner for index + text messages
 # - BLE imported lazily in __init__
 # - Singleton controller
 # - No scan/adv overlap
-# - Uses Timer(1)
+# - Uses a SoftTimer on the shared TimerService
 # ---------------------------------------------------------------------------
 
 _ble_singleton = None  # global singleton BLE controller
+# What the radio is doing (any Bluetooth object): light sleep would stop it
+_ble_scanning = False
+_ble_advertising = False
 
 
 def _short_id():
@@ -776,7 +2995,11 @@ class Bluetooth:
         self.on_text = None
         self.on_message = None
 
-        self._timer = Timer(1)  # distinct from Input's Timer(0)
+        # recv(): index/text messages kept from its first call on
+        self._inbox = None
+        self._rx_flag = None
+
+        self._timer = SoftTimer(self._stop_adv_resume)  # ends an advertising burst
 
         # Track last RX to drop duplicates (dev, ev, payload_key, ts)
         self._last_rx = (None, None, None, 0)
@@ -797,12 +3020,29 @@ class Bluetooth:
     # Advertising / scanning helpers
     # -------------------------------------------------------------------
     def start_scan(self):
+        global _ble_scanning
         # Restart scan with sane µs params + active scan
         try:
             self.ble.gap_scan(None)
         except:
             pass
+        _ble_scanning = False
         self.ble.gap_scan(0, self.SCAN_INTERVAL_US, self.SCAN_WINDOW_US, self.SCAN_ACTIVE)
+        _ble_scanning = True
+
+    def stop(self):
+        """Stop scanning and advertising (the radio stays on)."""
+        global _ble_scanning, _ble_advertising
+        self._timer.cancel()
+        try:
+            self.ble.gap_advertise(None)
+        except:
+            pass
+        try:
+            self.ble.gap_scan(None)
+        except:
+            pass
+        _ble_scanning = _ble_advertising = False
 
     def _adv_struct(self, atype, data):
         return bytes((len(data) + 1, atype)) + data
@@ -889,30 +3129,48 @@ class Bluetooth:
         """
         self._burst(self._mfg_text(self.dev_id, text))
 
+    async def recv(self, timeout_ms=None):
+        """
+        asyncio: the next index (int) or text (str) message, waiting up to
+        timeout_ms (None = for ever); None on timeout. From the first call
+        on, up to 8 unread messages are kept. Callbacks still run as well.
+        """
+        if self._inbox is None:
+            self._inbox = []
+            self._rx_flag = _new_flag()
+        while True:
+            _clear_flag(self._rx_flag)
+            if self._inbox:
+                return self._inbox.pop(0)
+            if not await _wait_flag(self._rx_flag, timeout_ms):
+                return None
+
     # -------------------------------------------------------------------
     # Low-level burst / stop / resume scan
     # -------------------------------------------------------------------
     def _burst(self, mfg):
+        global _ble_scanning, _ble_advertising
         payload = self._adv_payload(mfg)
         try:
             self.ble.gap_scan(None)
         except:
             pass
+        _ble_scanning = False
 
         self.ble.gap_advertise(self.ADV_INTERVAL_US, adv_data=payload)
-        self._timer.init(
-            mode=Timer.ONE_SHOT,
-            period=self.adv_ms,
-            callback=self._stop_adv_resume
-        )
+        _ble_advertising = True
+        self._timer.start(self.adv_ms)
 
     def _stop_adv_resume(self, _t=None):
+        global _ble_scanning, _ble_advertising
         try:
             self.ble.gap_advertise(None)
+            _ble_advertising = False
         finally:
             # Resume scanning with sane µs params + active scan
             try:
                 self.ble.gap_scan(0, self.SCAN_INTERVAL_US, self.SCAN_WINDOW_US, self.SCAN_ACTIVE)
+                _ble_scanning = True
             except:
                 pass
 
@@ -943,6 +3201,13 @@ class Bluetooth:
                 self._last_rx = (dev, ev, key, now)
 
                 # Dispatch to callbacks
+                if ev != self.EVT_PRESENCE:
+                    _activity()
+                    if self._inbox is not None and payload is not None:
+                        if len(self._inbox) >= 8:
+                            self._inbox.pop(0)  # keep the newest
+                        self._inbox.append(payload)
+                        self._rx_flag.set()
                 if ev == self.EVT_INDEX and payload is not None:
                     idx = payload
                     # Prefer on_index; fall back to legacy on_message
@@ -0,0 +1,232 @@
+# sprites.py — background layer + moving sprites for SmallDisplay games
+#
+# A Scene keeps a background picture and a list of sprites. render() only
+# repaints where something changed: for every sprite that moved (or changed
+# its text, image or visibility) the box it used to cover and the box it
+# covers now are restored from the background and the sprites touching them
+# are drawn again, in order. Only those page spans are marked dirty, so the
+# following show() sends just what moved.
+#
+#   from simple_esp import SmallDisplay
+#   from sprites import Scene, Sprite
+#
+#   disp = SmallDisplay()
+#   scene = Scene(disp)
+#   scene.background.hline(0, 39, 72, 1)    # draw the background once
+#   bird = scene.add(Sprite(3, 3))          # a filled 3x3 box
+#   while True:
+#       bird.move(18, y)
+#       scene.render()
+#       disp.show()
+#
+# Draw with the scene instead of fill()/fill_rect() while it is in use. After
+# drawing something else (a title or game-over screen) call invalidate().
+# Not for retained mode (see SmallDisplay.set_retained).
+
+import framebuf
+
+from simple_esp import get_font, measure
+
+
+class Sprite:
+    """
+    A w x h thing at (x, y): a filled box of color, an image (FrameBuffer,
+    drawn with key as the transparent colour) or a text string (opaque
+    cells in font, None = 5x7; w and h follow the text).
+    """
+    def __init__(self, w=1, h=1, x=0, y=0, color=1, image=None, key=-1, text=None, font=None):
+        self.w = w
+        self.h = h
+        self.x = x
+        self.y = y
+        self.color = color
+        self.image = image
+        self.key = key
+        self.font = font
+        self.text = None
+        self.visible = True
+        self.changed = True
+        self.drawn = None  # box on screen after the last render(), or None
+        if text is not None:
+            self.set_text(text)
+
+    def move(self, x, y):
+        x = int(x)
+        y = int(y)
+        if x != self.x or y != self.y:
+            self.x = x
+            self.y = y
+            self.changed = True
+
+    def set_text(self, s):
+        if s != self.text:
+            self.text = s
+            self.w = measure(s, self.font or "5x7")
+            self.h = get_font(self.font or "5x7").h
+            self.changed = True
+
+    def set_image(self, image, w, h):
+        if image is not self.image:
+            self.image = image
+            self.w = w
+            self.h = h
+            self.changed = True
+
+    def show(self, on=True):
+        if on != self.visible:
+            self.visible = on
+            self.changed = True
+
+    def box(self):
+        """(x0, y0, x1, y1) covered now, or None if hidden."""
+        if not self.visible or self.w <= 0 or self.h <= 0:
+            return None
+        return self.x, self.y, self.x + self.w - 1, self.y + self.h - 1
+
+    def draw(self, disp):
+        if self.text is not None:
+            disp.small_text(self.text, self.x, self.y, self.font)
+        elif self.image is not None:
+            disp.blit(self.image, self.x, self.y, self.w, self.h, self.key)
+        else:
+            disp.fill_rect(self.x, self.y, self.w, self.h, self.color)
+
+
+class Scene:
+    """
+    Background + sprites on a SmallDisplay. background is a FrameBuffer the
+    size of the window; after drawing on it call invalidate() (everything)
+    or mark(x, y, w, h) (just that area).
+    """
+    def __init__(self, disp):
+        self.disp = disp
+        self.width = disp.width
+        self.height = disp.height
+        self.pages = (self.height + 7) // 8
+        self.bg = bytearray(self.width * self.pages)
+        self.background = framebuf.FrameBuffer(self.bg, self.width, self.height, framebuf.MONO_VLSB)
+        self.sprites = []
+        # Page spans (first/last column) to repaint at the next render()
+        self._lo = bytearray(b"\xff" * self.pages)
+        self._hi = bytearray(self.pages)
+        self.invalidate()
+
+    def add(self, sprite, index=None):
+        """
+        Put sprite on top of the others, or at position index (0 = under
+        everything). Returns it.
+        """
+        sprite.changed = True
+        sprite.drawn = None
+        if index is None:
+            self.sprites.append(sprite)
+        else:
+            self.sprites.insert(index, sprite)
+        return sprite
+
+    def remove(self, sprite):
+        if sprite in self.sprites:
+            self.sprites.remove(sprite)
+            self._add_box(sprite.drawn)
+
+    def clear(self):
+        """Remove every sprite."""
+        for s in self.sprites:
+            self._add_box(s.drawn)
+        self.sprites = []
+
+    def mark(self, x, y, w, h):
+        """Repaint this area at the next render() (e.g. after changing the background)."""
+        self._add_box((x, y, x + w - 1, y + h - 1))
+
+    def invalidate(self):
+        """Repaint everything at the next render()."""
+        for p in range(self.pages):
+            self._lo[p] = 0
+            self._hi[p] = self.width - 1
+
+    def _add_box(self, box):
+        """Add box to the spans; True if that grew them."""
+        if box is None:
+            return False
+        x0, y0, x1, y1 = box
+        if x0 < 0: x0 = 0
+        if y0 < 0: y0 = 0
+        if x1 >= self.width: x1 = self.width - 1
+        if y1 >= self.height: y1 = self.height - 1
+        if x0 > x1 or y0 > y1:
+            return False
+        lo = self._lo
+        hi = self._hi
+        grew = False
+        for p in range(y0 >> 3, (y1 >> 3) + 1):
+            if x0 < lo[p]:
+                lo[p] = x0
+                grew = True
+            if x1 > hi[p]:
+                hi[p] = x1
+                grew = True
+        return grew
+
+    def _touches(self, box):
+        if box is None:
+            return False
+        x0, y0, x1, y1 = box
+        lo = self._lo
+        hi = self._hi
+        for p in range(max(0, y0 >> 3), min(self.pages - 1, y1 >> 3) + 1):
+            if x0 <= hi[p] and x1 >= lo[p]:
+                return True
+        return False
+
+    def render(self):
+        """Repaint what changed since the last render(). Returns True if anything did."""
+        for s in self.sprites:
+            if s.changed:
+                self._add_box(s.drawn)
+                self._add_box(s.box())
+
+        # Repainting whole pages may cut through sprites that did not move:
+        # take them in too, until no span grows any more
+        grew = True
+        while grew:
+            grew = False
+            for s in self.sprites:
+                b = s.box()
+                if self._touches(b) and self._add_box(b):
+                    grew = True
+
+        lo = self._lo
+        hi = self._hi
+        disp = self.disp
+        d = disp.driver
+        any_span = False
+        if disp._dl is not None:
+            raise ValueError("Scene can't draw in retained mode")
+        if d is not None:
+            w = d.width
+            xo = disp.x_offset
+            yo = disp.y_offset
+            for p in range(self.pages):
+                if lo[p] > hi[p]:
+                    continue
+                any_span = True
+                n = hi[p] - lo[p] + 1
+                i = ((yo >> 3) + p) * w + xo + lo[p]
+                j = p * self.width + lo[p]
+                d.buffer[i:i + n] = self.bg[j:j + n]
+                d.mark_dirty(xo + lo[p], yo + p * 8, n, 8)
+                if disp.mirror is not None:
+                    disp._forget_text(lo[p], p * 8, n, 8)
+            if any_span:
+                for s in self.sprites:
+                    if self._touches(s.box()):
+                        s.draw(disp)
+
+        for s in self.sprites:
+            s.changed = False
+            s.drawn = s.box()
+        for p in range(self.pages):
+            lo[p] = 0xFF
+            hi[p] = 0
+        return any_span
@@ -1,6 +1,7 @@
 # main.py — Sideways Tetris (left→right) for 72×40 OLED
 # Needs: mini_display.py with SmallDisplay, Input
-from simple_esp import SmallDisplay, Input
+from simple_esp import SmallDisplay, Input, measure
+from sprites import Scene, Sprite
 import time
 import urandom as random
 
@@ -10,6 +11,7 @@ COLS = 18   # 18 * 4 = 72 px
 ROWS = 10   # 10 * 4 = 40 px
 W = COLS * CELL
 H = ROWS * CELL
+SHOW_STATS = False  # True: frames per second and ms per show() in the corner
 
 # ======= PIECES (Tetriminos) =======
 # Each piece is a list of rotation states; each state is a list of (x,y) offsets.
@@ -45,8 +47,17 @@ TETROS = [
 
 # ======= GAME STATE =======
 disp = SmallDisplay()
+disp.set_stats(SHOW_STATS, overlay=SHOW_STATS)
 btn  = Input(pin_no=9, active_low=True, debounce_ms=80, long_ms=600, double_ms=350)
 
+# Locked cells are the scene's background (redrawn when a piece locks);
+# the falling piece and the HUD are sprites, so a frame only sends what moved
+scene = Scene(disp)
+piece_cells = [scene.add(Sprite(CELL, CELL)) for _ in range(4)]
+level_text = scene.add(Sprite(text=""))
+score_text = scene.add(Sprite(text=""))
+grid_changed = True
+
 grid = [[0 for _ in range(COLS)] for _ in range(ROWS)]  # 0 empty, 1 filled
 score = 0
 best  = 0
@@ -180,11 +191,12 @@ def move(ox, oy):
 
 def step_forward():
     """Gravity to the RIGHT: try to move +x; if blocked, lock and spawn next."""
-    global state
+    global state, grid_changed
     if move(1, 0):
         return
     # Cannot move right: lock
     lock_piece()
+    grid_changed = True
     cleared = clear_full_columns()
     add_score(cleared)
     # New piece
@@ -196,29 +208,41 @@ def step_forward():
 
 # ======= RENDER =======
 def draw_cell(gx, gy, c=1):
-    disp.fill_rect(gx*CELL, gy*CELL, CELL, CELL, c)
+    scene.background.fill_rect(gx*CELL, gy*CELL, CELL, CELL, c)
 
 def draw_grid():
-    # Filled cells
+    # Filled cells, into the background
+    scene.background.fill(0)
     for y in range(ROWS):
         for x in range(COLS):
             if grid[y][x]:
                 draw_cell(x,y,1)
-    # Active piece (draw last)
+    scene.invalidate()
+
+def draw_piece():
+    # Active piece (drawn over the grid)
+    i = 0
     for x, y in cells_of():
-        if in_bounds(x,y):
-            draw_cell(x,y,1)
+        cell = piece_cells[i]
+        cell.show(in_bounds(x,y))
+        cell.move(x*CELL, y*CELL)
+        i += 1
 
 def draw_hud():
     # Top bar: score (right), level (left)
     s = str(score)
-    disp.small_text(f"L{level}", 0, 0)
-    disp.small_text(s[:12], max(0, 72 - len(s)*6), 0)
+    level_text.set_text(f"L{level}")
+    score_text.set_text(s[:12])
+    score_text.move(max(0, 72 - measure(s[:12])), 0)
 
 def render_play():
-    disp.fill(0)
-    draw_grid()
+    global grid_changed
+    if grid_changed:
+        grid_changed = False
+        draw_grid()
+    draw_piece()
     draw_hud()
+    scene.render()
     disp.show()
 
 def draw_title():
@@ -240,7 +264,8 @@ def draw_over():
 
 # ======= FLOW =======
 def start_or_retry():
-    global grid, score, level, state, piece, next_piece
+    global grid, score, level, state, piece, next_piece, grid_changed
+    grid_changed = True  # the title / game over screen covered the game
     if state == "title":
         if piece is None:
             next_piece = None
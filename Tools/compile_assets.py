@@ -0,0 +1,134 @@
+# compile_assets.py — turn the apps' ASCII art into ready-to-blit bitmaps
+#
+# Reads the art strings straight out of the app sources (module-level
+# `name = """..."""` assignments, found with ast so nothing is executed),
+# scales and packs them with the same code as SmallDisplay.create_image(),
+# and writes:
+#
+#   --py FILE   a module with IMAGES = {name: (w, h, key, bytes)}
+#               (default: Python Code/assets.py, upload it with the apps)
+#   --bin DIR   one DIR/<name>.bin per image: w, h, 13-byte key, bytes
+#               (upload DIR as /images on the board)
+#
+# On the board SmallDisplay.load_image(name) returns the FrameBuffer, and
+# create_image(art, ..., name=name) uses it whenever the key still matches
+# the art, so edited art falls back to rendering until you re-run this.
+#
+# Usage:
+#   python compile_assets.py                        # the built-in list below
+#   python compile_assets.py pet:happy_face:72x24:pet.happy logo:logo
+#   python compile_assets.py --bin images --py ""   # .bin files only
+
+import ast
+import os
+import sys
+
+import emulator
+
+# module, variable, (width, height), asset name — the same sizes the apps use
+ASSETS = [
+    ("logo", "logo", (72, 40), "logo"),
+    ("pet", "happy_face", (72, 24), "pet.happy"),
+    ("pet", "ok_face", (72, 24), "pet.ok"),
+    ("pet", "sad_face", (72, 24), "pet.sad"),
+    ("pet", "dead_face", (72, 24), "pet.dead"),
+    ("happy", "smile", (72, 40), "happy.smile"),
+    ("happy", "sad", (72, 40), "happy.sad"),
+    ("happy", "neutral", (72, 40), "happy.neutral"),
+    ("happy", "blank", (72, 40), "happy.blank"),
+]
+
+
+def parse_spec(spec):
+    """module:var[:WxH[:name]] -> (module, var, (w, h), name)"""
+    parts = spec.split(":")
+    if len(parts) < 2:
+        raise ValueError("expected module:var[:WxH[:name]], got %r" % spec)
+    size = (72, 40)
+    if len(parts) > 2 and parts[2]:
+        w, h = parts[2].lower().split("x")
+        size = (int(w), int(h))
+    name = parts[3] if len(parts) > 3 else "%s.%s" % (parts[0], parts[1])
+    return parts[0], parts[1], size, name
+
+
+def art_strings(path):
+    """{variable: str} for every module-level string assignment in path."""
+    with open(path) as f:
+        tree = ast.parse(f.read(), path)
+    found = {}
+    for node in tree.body:
+        if (isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant)
+                and isinstance(node.value.value, str)):
+            for t in node.targets:
+                if isinstance(t, ast.Name):
+                    found[t.id] = node.value.value
+    return found
+
+
+def compile_image(simple_esp, art, w, h, scale_to_fit=True):
+    """(key, bytes) exactly as create_image(art, w, h, scale_to_fit) builds them."""
+    s = art[1:] if art.startswith("\n") else art
+    lines = [ln.rstrip("\n") for ln in s.splitlines()]
+    buf = bytearray(w * ((h + 7) // 8))
+    if lines:
+        simple_esp._pack_ascii(lines, w, h, scale_to_fit, buf)
+    return simple_esp._image_key(art, w, h, scale_to_fit), bytes(buf)
+
+
+def write_py(path, images):
+    with open(path, "w") as f:
+        f.write("# assets.py — generated by Tools/compile_assets.py, do not edit\n")
+        f.write("# name: (width, height, key, MONO_VLSB bytes); see SmallDisplay.load_image()\n\n")
+        f.write("IMAGES = {\n")
+        for name, w, h, key, data in images:
+            f.write("    %r: (%d, %d, %r,\n" % (name, w, h, key))
+            for i in range(0, len(data), 24):
+                f.write("        %r\n" % data[i:i + 24])
+            f.write("    ),\n")
+        f.write("}\n")
+
+
+def write_bin(dirname, images):
+    os.makedirs(dirname, exist_ok=True)
+    for name, w, h, key, data in images:
+        with open(os.path.join(dirname, name + ".bin"), "wb") as f:
+            f.write(bytes((w, h)) + key.encode() + data)
+
+
+def main(argv):
+    import argparse
+    ap = argparse.ArgumentParser(description="Compile ASCII art into MONO_VLSB bitmaps")
+    ap.add_argument("specs", nargs="*", help="module:var[:WxH[:name]] (default: built-in list)")
+    ap.add_argument("--src", default=emulator.CODE_DIR, help="folder with the app .py files")
+    ap.add_argument("--py", default=None, help="generated module (default: <src>/assets.py, '' = none)")
+    ap.add_argument("--bin", default=None, help="folder for <name>.bin files")
+    args = ap.parse_args(argv)
+
+    emulator.install(code_dir=args.src)
+    import simple_esp
+
+    specs = [parse_spec(s) for s in args.specs] if args.specs else ASSETS
+    sources = {}
+    images = []
+    for module, var, (w, h), name in specs:
+        if module not in sources:
+            sources[module] = art_strings(os.path.join(args.src, module + ".py"))
+        art = sources[module].get(var)
+        if art is None:
+            sys.exit("%s.py has no string %s" % (module, var))
+        key, data = compile_image(simple_esp, art, w, h)
+        images.append((name, w, h, key, data))
+        print("%-14s %-16s %dx%d  %s  %d bytes" % (name, module + "." + var, w, h, key, len(data)))
+
+    py = os.path.join(args.src, "assets.py") if args.py is None else args.py
+    if py:
+        write_py(py, images)
+        print("wrote", py)
+    if args.bin:
+        write_bin(args.bin, images)
+        print("wrote %d files to %s" % (len(images), args.bin))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
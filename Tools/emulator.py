@@ -0,0 +1,767 @@
+# emulator.py — run the Python Code apps on a PC with no ESP32 attached
+#
+# Provides CPython stand-ins for the MicroPython modules the apps import
+# (machine, framebuf, micropython and the extra time.ticks_* functions) and a
+# virtual SH1106 panel on the I2C bus. The panel decodes the real command
+# stream into a 132x64 GDDRAM, so what you capture is what the OLED would show.
+#
+# Counters on the panel record I2C transactions, bytes and modelled bus time
+# at the bus clock the code asked for, so rendering changes can be measured
+# on a build server.
+#
+# Usage:
+#   python emulator.py logo                   # run logo.main(), save frame
+#   python emulator.py --seconds 3 tetris     # stop after 3 seconds
+#   python emulator.py --png out.png --scale 4 logo
+#
+# Or from another script:
+#   import emulator
+#   panel = emulator.install()
+#   from simple_esp import SmallDisplay
+#   ...
+#   panel.save_png("frame.png", window=True)
+
+import _thread
+import os
+import signal
+import sys
+import struct
+import threading
+import time
+import types
+import zlib
+
+CODE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                         "..", "Python Code"))
+
+MONO_VLSB = 0
+MONO_HLSB = 3
+MONO_HMSB = 4
+
+# The visible 72x40 area of the 0.42" panel inside the SH1106 RAM (x, y, w, h)
+WINDOW = (28, 24, 72, 40)
+
+_T0 = time.perf_counter()
+
+# ---------------------------------------------------------------------------
+# time — MicroPython extras
+# ---------------------------------------------------------------------------
+_TICKS_PERIOD = 1 << 30
+_TICKS_MAX = _TICKS_PERIOD - 1
+
+
+def ticks_ms():
+    return int((time.perf_counter() - _T0) * 1000) & _TICKS_MAX
+
+
+def ticks_us():
+    return int((time.perf_counter() - _T0) * 1000000) & _TICKS_MAX
+
+
+def ticks_cpu():
+    return ticks_us()
+
+
+def ticks_add(t, delta):
+    return (t + delta) & _TICKS_MAX
+
+
+def ticks_diff(t1, t0):
+    d = (t1 - t0) & _TICKS_MAX
+    if d >= _TICKS_PERIOD // 2:
+        d -= _TICKS_PERIOD
+    return d
+
+
+def sleep_ms(ms):
+    if ms > 0:
+        time.sleep(ms / 1000)
+    _run_scheduled()
+
+
+def sleep_us(us):
+    if us > 0:
+        time.sleep(us / 1000000)
+    _run_scheduled()
+
+
+# ---------------------------------------------------------------------------
+# micropython
+# ---------------------------------------------------------------------------
+_sched = []
+_sched_lock = threading.Lock()
+SCHEDULE_DEPTH = 8
+
+
+def schedule(fn, arg):
+    """
+    Queue fn(arg) like the board does: it runs on the app (main) thread at
+    the next sleep_ms() / sleep_us() / idle() / lightsleep(), right after
+    an IRQ handler fired by set_pin(), or soon in a running asyncio loop;
+    never inside the caller.
+    """
+    with _sched_lock:
+        if len(_sched) >= SCHEDULE_DEPTH:
+            raise RuntimeError("schedule queue full")
+        _sched.append((fn, arg))
+    loop = _loop
+    if loop is not None:
+        try:
+            loop.call_soon_threadsafe(_run_scheduled)
+        except RuntimeError:
+            pass  # the loop just closed
+
+
+def _run_scheduled():
+    if threading.current_thread() is not threading.main_thread():
+        return
+    while True:
+        with _sched_lock:
+            if not _sched:
+                return
+            fn, arg = _sched.pop(0)
+        fn(arg)
+
+
+def const(x):
+    return x
+
+
+# ---------------------------------------------------------------------------
+# asyncio: while asyncio.run() runs on the main thread, it drains the queue
+# ---------------------------------------------------------------------------
+_loop = None        # the event loop asyncio.run() is running, if any
+_asyncio_run = None  # CPython's asyncio.run
+
+
+def _install_asyncio():
+    global _asyncio_run
+    import asyncio
+    if _asyncio_run is None:
+        _asyncio_run = asyncio.run
+
+    def run(main, **kw):
+        async def wrapped():
+            global _loop
+            _loop = asyncio.get_running_loop()
+            try:
+                _run_scheduled()  # what was queued before the loop started
+                return await main
+            finally:
+                _loop = None
+        return _asyncio_run(wrapped(), **kw)
+
+    asyncio.run = run
+
+
+# ---------------------------------------------------------------------------
+# framebuf
+# ---------------------------------------------------------------------------
+class FrameBuffer:
+    """MONO_VLSB FrameBuffer with the same clipping rules as MicroPython."""
+
+    def __init__(self, buf, width, height, fmt, stride=None):
+        if fmt != MONO_VLSB:
+            raise NotImplementedError("emulator only supports MONO_VLSB")
+        self.buf = buf
+        self.width = width
+        self.height = height
+        self.stride = width if stride is None else stride
+        if len(buf) < self.stride * ((height + 7) // 8):
+            raise ValueError("buffer too small")
+
+    def _set(self, x, y, c):
+        i = (y >> 3) * self.stride + x
+        if c:
+            self.buf[i] |= 1 << (y & 7)
+        else:
+            self.buf[i] &= ~(1 << (y & 7)) & 0xFF
+
+    def _get(self, x, y):
+        return (self.buf[(y >> 3) * self.stride + x] >> (y & 7)) & 1
+
+    def pixel(self, x, y, c=None):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            if c is None:
+                return self._get(x, y)
+            self._set(x, y, c)
+        return None
+
+    def fill(self, c):
+        self.fill_rect(0, 0, self.width, self.height, c)
+
+    def fill_rect(self, x, y, w, h, c):
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(self.width, x + w), min(self.height, y + h)
+        for yy in range(y0, y1):
+            for xx in range(x0, x1):
+                self._set(xx, yy, c)
+
+    def hline(self, x, y, w, c):
+        self.fill_rect(x, y, w, 1, c)
+
+    def vline(self, x, y, h, c):
+        self.fill_rect(x, y, 1, h, c)
+
+    def rect(self, x, y, w, h, c, f=False):
+        if f:
+            self.fill_rect(x, y, w, h, c)
+            return
+        self.fill_rect(x, y, w, 1, c)
+        self.fill_rect(x, y + h - 1, w, 1, c)
+        self.fill_rect(x, y, 1, h, c)
+        self.fill_rect(x + w - 1, y, 1, h, c)
+
+    def line(self, x1, y1, x2, y2, c):
+        dx = x2 - x1
+        sx = 1 if dx > 0 else -1
+        dx = abs(dx)
+        dy = y2 - y1
+        sy = 1 if dy > 0 else -1
+        dy = abs(dy)
+        steep = dy > dx
+        if steep:
+            x1, y1 = y1, x1
+            dx, dy = dy, dx
+            sx, sy = sy, sx
+        e = 2 * dy - dx
+        for _ in range(dx):
+            if steep:
+                self.pixel(y1, x1, c)
+            else:
+                self.pixel(x1, y1, c)
+            while e >= 0:
+                y1 += sy
+                e -= 2 * dx
+            x1 += sx
+            e += 2 * dy
+        self.pixel(x2, y2, c)
+
+    def ellipse(self, cx, cy, xr, yr, c, f=False, m=0xF):
+        # Midpoint ellipse; quadrant mask as in MicroPython (Q1=1, Q2=2, Q3=4, Q4=8)
+        def plot(x, y):
+            for bit, px, py in ((1, cx + x, cy - y), (2, cx - x, cy - y),
+                                (4, cx - x, cy + y), (8, cx + x, cy + y)):
+                if m & bit:
+                    if f:
+                        if px >= cx:
+                            self.hline(cx, py, px - cx + 1, c)
+                        else:
+                            self.hline(px, py, cx - px + 1, c)
+                    else:
+                        self.pixel(px, py, c)
+
+        if xr == 0 and yr == 0:
+            self.pixel(cx, cy, c)
+            return
+        a2, b2 = xr * xr, yr * yr
+        x, y = 0, yr
+        d1 = b2 - a2 * yr + a2 // 4
+        while b2 * x <= a2 * y:
+            plot(x, y)
+            if d1 < 0:
+                d1 += b2 * (2 * x + 3)
+            else:
+                d1 += b2 * (2 * x + 3) + a2 * (-2 * y + 2)
+                y -= 1
+            x += 1
+        d2 = b2 * (x * x + x) + a2 * (y - 1) * (y - 1) - a2 * b2
+        while y >= 0:
+            plot(x, y)
+            if d2 > 0:
+                d2 += a2 * (-2 * y + 3)
+            else:
+                d2 += b2 * (2 * x + 2) + a2 * (-2 * y + 3)
+                x += 1
+            y -= 1
+
+    def text(self, s, x, y, c=1):
+        # The 8x8 ROM font is not shipped; draw a 6x7 box per visible char
+        for ch in s:
+            if ch != " ":
+                self.rect(x + 1, y, 6, 7, c)
+            x += 8
+
+    def blit(self, src, x, y, key=-1, palette=None):
+        if isinstance(src, tuple):
+            src = FrameBuffer(*src)
+        for sy in range(src.height):
+            yy = y + sy
+            if not 0 <= yy < self.height:
+                continue
+            for sx in range(src.width):
+                xx = x + sx
+                if not 0 <= xx < self.width:
+                    continue
+                col = src._get(sx, sy)
+                if col != key:
+                    if palette is not None:
+                        col = palette.pixel(col, 0)
+                    self._set(xx, yy, col)
+
+    def scroll(self, xstep, ystep):
+        if xstep < 0:
+            sx, xend, dx = 0, self.width + xstep, 1
+            if xend <= 0:
+                return
+        else:
+            sx, xend, dx = self.width - 1, xstep - 1, -1
+            if xend >= sx:
+                return
+        if ystep < 0:
+            y, yend, dy = 0, self.height + ystep, 1
+            if yend <= 0:
+                return
+        else:
+            y, yend, dy = self.height - 1, ystep - 1, -1
+            if yend >= y:
+                return
+        while y != yend:
+            x = sx
+            while x != xend:
+                self._set(x, y, self._get(x - xstep, y - ystep))
+                x += dx
+            y += dy
+
+
+# ---------------------------------------------------------------------------
+# Virtual SH1106 panel
+# ---------------------------------------------------------------------------
+# Commands that take one argument byte
+_TWO_BYTE = (0x81, 0xA8, 0xD3, 0xD5, 0xD9, 0xDA, 0xDB, 0x8D, 0xAD, 0x20)
+
+
+class SH1106Panel:
+    """Decodes the SH1106 I2C command stream into a 132x64 GDDRAM."""
+
+    COLS = 132
+    PAGES = 8
+
+    def __init__(self, addr=0x3C, max_freq=None):
+        self.addr = addr
+        self.max_freq = max_freq     # writes above this clock NACK (OSError)
+        self.ram = bytearray(self.COLS * self.PAGES)
+        self.page = 0
+        self.col = 0
+        self.start_line = 0
+        self.contrast = 0x80
+        self.display_on = False
+        self.inverted = False
+        self._pending = None
+        self.frames = []             # filled by capture()
+        self.reset_counters()
+
+    # -- counters --
+    def reset_counters(self):
+        self.transactions = 0
+        self.bytes = 0           # payload bytes (control + command + data)
+        self.data_bytes = 0      # GDDRAM bytes written
+        self.commands = 0
+        self.bus_us = 0.0        # modelled time on the wire
+
+    def model_us(self, freq):
+        """Bus time the traffic so far would take at another I2C clock."""
+        return int(((self.bytes + self.transactions) * 9 + 2 * self.transactions) * 1000000 / freq)
+
+    def counters(self):
+        return {
+            "transactions": self.transactions,
+            "bytes": self.bytes,
+            "data_bytes": self.data_bytes,
+            "commands": self.commands,
+            "bus_us": int(self.bus_us),
+        }
+
+    # -- bus side --
+    def transaction(self, data, freq):
+        if self.max_freq is not None and freq > self.max_freq:
+            raise OSError(5)  # EIO: panel NACKed at this clock
+        data = bytes(data)
+        self.transactions += 1
+        self.bytes += len(data)
+        # START + address byte + payload, 9 clocks per byte, STOP
+        self.bus_us += ((len(data) + 1) * 9 + 2) * 1000000 / freq
+        i, n = 0, len(data)
+        while i < n:
+            ctrl = data[i]
+            i += 1
+            is_data = ctrl & 0x40
+            if ctrl & 0x80:          # Co=1: one byte, then another control byte
+                if i < n:
+                    self._data(data[i]) if is_data else self._cmd(data[i])
+                    i += 1
+            else:                    # Co=0: everything that follows
+                for b in data[i:]:
+                    self._data(b) if is_data else self._cmd(b)
+                i = n
+
+    def _data(self, b):
+        self.data_bytes += 1
+        if self.col < self.COLS:
+            self.ram[self.page * self.COLS + self.col] = b
+            self.col += 1
+
+    def _cmd(self, b):
+        self.commands += 1
+        if self._pending is not None:
+            c = self._pending
+            self._pending = None
+            if c == 0x81:
+                self.contrast = b
+            return
+        if b in _TWO_BYTE:
+            self._pending = b
+        elif 0xB0 <= b <= 0xB7:
+            self.page = b & 0x07
+        elif b <= 0x0F:
+            self.col = (self.col & 0xF0) | b
+        elif 0x10 <= b <= 0x1F:
+            self.col = (self.col & 0x0F) | ((b & 0x0F) << 4)
+        elif 0x40 <= b <= 0x7F:
+            self.start_line = b & 0x3F
+        elif b == 0xAE:
+            self.display_on = False
+        elif b == 0xAF:
+            self.display_on = True
+        elif b in (0xA6, 0xA7):
+            self.inverted = bool(b & 1)
+
+    # -- what the glass shows --
+    def pixel(self, x, y):
+        """Pixel at display row y (start line applied), RAM column x."""
+        r = (y + self.start_line) & 63
+        return (self.ram[(r >> 3) * self.COLS + x] >> (r & 7)) & 1
+
+    def rows(self, window=False):
+        x0, y0, w, h = WINDOW if window else (0, 0, self.COLS, 64)
+        on = self.display_on
+        inv = 1 if self.inverted else 0
+        return [[(self.pixel(x, y) ^ inv) if on else 0 for x in range(x0, x0 + w)]
+                for y in range(y0, y0 + h)]
+
+    def capture(self, window=True):
+        """Append the current frame to self.frames and return it."""
+        f = self.rows(window)
+        self.frames.append(f)
+        return f
+
+    def ascii(self, window=True):
+        return "\n".join("".join("#" if p else "." for p in row)
+                         for row in self.rows(window))
+
+    def save_pbm(self, path, window=True):
+        rows = self.rows(window)
+        w, h = len(rows[0]), len(rows)
+        out = bytearray()
+        for row in rows:
+            for i in range(0, w, 8):
+                b = 0
+                for j, p in enumerate(row[i:i + 8]):
+                    if p:
+                        b |= 0x80 >> j
+                out.append(b)
+        with open(path, "wb") as f:
+            f.write(b"P4\n%d %d\n" % (w, h))
+            f.write(out)
+
+    def save_png(self, path, window=True, scale=1):
+        rows = self.rows(window)
+        w, h = len(rows[0]) * scale, len(rows) * scale
+        raw = bytearray()
+        for row in rows:
+            line = bytearray([0])
+            for p in row:
+                line.extend((255 if p else 0,) * scale)
+            for _ in range(scale):
+                raw.extend(line)
+
+        def chunk(kind, body):
+            c = kind + body
+            return struct.pack(">I", len(body)) + c + struct.pack(">I", zlib.crc32(c) & 0xFFFFFFFF)
+
+        with open(path, "wb") as f:
+            f.write(b"\x89PNG\r\n\x1a\n")
+            f.write(chunk(b"IHDR", struct.pack(">IIBBBBB", w, h, 8, 0, 0, 0, 0)))
+            f.write(chunk(b"IDAT", zlib.compress(bytes(raw), 9)))
+            f.write(chunk(b"IEND", b""))
+
+
+# ---------------------------------------------------------------------------
+# machine
+# ---------------------------------------------------------------------------
+class Pin:
+    IN, OUT, OPEN_DRAIN = 1, 3, 7
+    PULL_UP, PULL_DOWN = 1, 2
+    IRQ_RISING, IRQ_FALLING = 1, 2
+    WAKE_LOW, WAKE_HIGH = 4, 5
+
+    _levels = {}
+    _handlers = {}
+    _wakes = {}  # pin -> WAKE_LOW / WAKE_HIGH, armed with irq(wake=...)
+
+    def __init__(self, pin_id, mode=-1, pull=-1, value=None):
+        self.id = pin_id
+        if pin_id not in Pin._levels:
+            Pin._levels[pin_id] = 1 if pull == Pin.PULL_UP else 0
+        if value is not None:
+            Pin._levels[pin_id] = 1 if value else 0
+
+    def value(self, v=None):
+        if v is None:
+            return Pin._levels[self.id]
+        Pin._levels[self.id] = 1 if v else 0
+
+    def on(self):
+        self.value(1)
+
+    def off(self):
+        self.value(0)
+
+    def irq(self, handler=None, trigger=3, wake=None, hard=False):
+        if wake and trigger in (Pin.WAKE_LOW, Pin.WAKE_HIGH):
+            Pin._handlers[self.id] = (None, 0)  # like the ESP32: no IRQ, only the wake-up
+            Pin._wakes[self.id] = trigger
+        else:
+            Pin._handlers[self.id] = (handler, trigger)
+            Pin._wakes.pop(self.id, None)
+
+    def __repr__(self):
+        return "Pin(%d)" % self.id
+
+
+def set_pin(pin_id, level):
+    """Drive an input pin from the test side, firing its IRQ handler."""
+    old = Pin._levels.get(pin_id, 1)
+    Pin._levels[pin_id] = level
+    h = Pin._handlers.get(pin_id)
+    if h and h[0] and old != level:
+        edge = Pin.IRQ_RISING if level else Pin.IRQ_FALLING
+        if h[1] & edge:
+            h[0](Pin(pin_id))
+            _run_scheduled()
+
+
+def click(pin_id=9, hold_ms=60, active_low=True):
+    """Press and release a button (blocking for hold_ms)."""
+    set_pin(pin_id, 0 if active_low else 1)
+    sleep_ms(hold_ms)
+    set_pin(pin_id, 1 if active_low else 0)
+
+
+class I2C:
+    def __init__(self, bus_id=0, scl=None, sda=None, freq=400000, timeout=50000):
+        self.freq = freq
+
+    def _dev(self, addr):
+        p = _panel
+        if p is None or addr != p.addr:
+            raise OSError(19)  # ENODEV
+        return p
+
+    def writeto(self, addr, buf, stop=True):
+        self._dev(addr).transaction(buf, self.freq)
+        return len(buf)
+
+    def writevto(self, addr, vector, stop=True):
+        data = b"".join(bytes(v) for v in vector)
+        self._dev(addr).transaction(data, self.freq)
+
+    def scan(self):
+        return [_panel.addr] if _panel else []
+
+
+class Timer:
+    ONE_SHOT, PERIODIC = 0, 1
+
+    def __init__(self, timer_id=0, **kw):
+        self.id = timer_id
+        self._t = None
+        if kw:
+            self.init(**kw)
+
+    def init(self, mode=PERIODIC, period=-1, callback=None, freq=None):
+        self.deinit()
+        if freq:
+            period = int(1000 / freq)
+        self._cb = callback
+        self._mode = mode
+        self._period = max(1, period)
+        self._arm()
+
+    def _arm(self):
+        self._t = threading.Timer(self._period / 1000, self._expire)
+        self._t.daemon = True
+        self._t.start()
+
+    def _expire(self):
+        if self._mode == Timer.PERIODIC:
+            self._arm()
+        if self._cb and not _asleep:  # timers stand still in light sleep
+            try:
+                schedule(self._cb, self)
+            except RuntimeError:
+                pass  # queue full: this tick is lost, as on the board
+
+    def deinit(self):
+        if self._t is not None:
+            self._t.cancel()
+            self._t = None
+
+
+class PWM:
+    def __init__(self, pin, freq=50, duty_u16=0):
+        self.pin, self._freq, self._duty = pin, freq, duty_u16
+
+    def freq(self, f=None):
+        if f is None:
+            return self._freq
+        self._freq = f
+
+    def duty_u16(self, d=None):
+        if d is None:
+            return self._duty
+        self._duty = d
+
+    def deinit(self):
+        pass
+
+
+class RTC:
+    def datetime(self, dt=None):
+        t = time.localtime()
+        return (t.tm_year, t.tm_mon, t.tm_mday, t.tm_wday, t.tm_hour, t.tm_min, t.tm_sec, 0)
+
+
+def unique_id():
+    return b"\xe4\xb0\x63\x12\x34\x56"
+
+
+IDLE, SLEEP, DEEPSLEEP = 1, 2, 4
+_asleep = False
+
+
+def lightsleep(ms=None):
+    """sleep_ms(ms) (None = for ever), ended early by a pin armed with irq(wake=SLEEP)."""
+    global _asleep
+    end = None if ms is None else time.perf_counter() + ms / 1000
+    _asleep = True
+    try:
+        while end is None or time.perf_counter() < end:
+            if any(Pin._levels.get(p, 1) == (1 if t == Pin.WAKE_HIGH else 0)
+                   for p, t in Pin._wakes.items()):
+                break
+            time.sleep(0.001)
+    finally:
+        _asleep = False
+    _run_scheduled()
+
+
+def idle():
+    time.sleep(0.0005)
+    _run_scheduled()
+
+
+def freq(f=None):
+    return 160000000
+
+
+# ---------------------------------------------------------------------------
+# Installation
+# ---------------------------------------------------------------------------
+_panel = None
+
+
+def install(max_freq=None, code_dir=CODE_DIR):
+    """Register the fake modules and a fresh panel; return the panel."""
+    global _panel
+    _panel = SH1106Panel(max_freq=max_freq)
+
+    for name in ("ticks_ms", "ticks_us", "ticks_cpu", "ticks_add",
+                 "ticks_diff", "sleep_ms", "sleep_us"):
+        setattr(time, name, globals()[name])
+
+    me = sys.modules[__name__]
+    mods = {
+        "machine": ("Pin", "I2C", "Timer", "PWM", "RTC", "unique_id",
+                    "lightsleep", "idle", "freq", "IDLE", "SLEEP", "DEEPSLEEP"),
+        "framebuf": ("FrameBuffer", "MONO_VLSB", "MONO_HLSB", "MONO_HMSB"),
+        "micropython": ("const", "schedule"),
+    }
+    for name, attrs in mods.items():
+        m = types.ModuleType(name)
+        for a in attrs:
+            setattr(m, a, getattr(me, a))
+        sys.modules[name] = m
+    _install_asyncio()
+    sys.modules.setdefault("urandom", __import__("random"))
+    sys.modules.setdefault("ujson", __import__("json"))
+
+    if code_dir and code_dir not in sys.path:
+        sys.path.insert(0, code_dir)
+    return _panel
+
+
+def panel():
+    return _panel
+
+
+def _main(argv):
+    import argparse
+    ap = argparse.ArgumentParser(description="Run an app against a virtual SH1106")
+    ap.add_argument("module", help="app module in Python Code, e.g. logo")
+    ap.add_argument("func", nargs="?", default="main")
+    ap.add_argument("--seconds", type=float, default=None,
+                    help="stop the app after this long (for apps that loop forever)")
+    ap.add_argument("--max-freq", type=int, default=None,
+                    help="make the panel NACK above this I2C clock")
+    ap.add_argument("--pbm", help="save the final window as PBM")
+    ap.add_argument("--png", help="save the final window as PNG")
+    ap.add_argument("--scale", type=int, default=4, help="PNG pixel scale")
+    ap.add_argument("--full", action="store_true", help="dump all 132x64 RAM, not just the window")
+    args = ap.parse_args(argv)
+
+    p = install(max_freq=args.max_freq)
+    done = threading.Lock()
+
+    def report():
+        if done.acquire(False):
+            _report(p, args)
+
+    if args.seconds is not None:
+        # The app stays on the main thread (scheduled callbacks run there);
+        # stop it like Ctrl-C in Thonny, or for good if it ignores that
+        def watchdog():
+            if hasattr(signal, "pthread_kill"):
+                # a real SIGINT also wakes a main thread blocked in select()
+                signal.pthread_kill(threading.main_thread().ident, signal.SIGINT)
+            else:
+                _thread.interrupt_main()
+            time.sleep(2)
+            report()
+        threading.Timer(args.seconds, watchdog).start()
+
+    try:
+        mod = __import__(args.module)
+        getattr(mod, args.func)()
+    except KeyboardInterrupt:
+        if args.seconds is None:
+            raise
+    report()
+
+
+def _report(p, args):
+    window = not args.full
+    print(p.ascii(window))
+    c = p.counters()
+    print("transactions={transactions} bytes={bytes} data_bytes={data_bytes} "
+          "commands={commands} bus_us={bus_us}".format(**c))
+    if args.pbm:
+        p.save_pbm(args.pbm, window)
+    if args.png:
+        p.save_png(args.png, window, args.scale)
+    sys.stdout.flush()
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    _main(sys.argv[1:])
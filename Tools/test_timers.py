@@ -0,0 +1,72 @@
+"""
+SoftTimer / TimerService checks, run in the emulator:
+
+    python test_timers.py        (or: python -m pytest test_timers.py)
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import emulator
+
+emulator.install()  # before simple_esp
+
+import time
+from simple_esp import TimerService
+
+
+def _run(ms):
+    end = time.ticks_add(time.ticks_ms(), ms)
+    while time.ticks_diff(end, time.ticks_ms()) > 0:
+        time.sleep_ms(5)  # scheduled timer ticks run here
+
+
+def _cancel_in_same_tick(a_first):
+    svc = TimerService(hw_id=1)
+    fired = {"a": 0, "b": 0}
+    timers = {}
+
+    def on_a(t):
+        fired["a"] += 1
+        timers["b"].cancel()
+
+    def on_b(t):
+        fired["b"] += 1
+
+    # Timers due in the same tick fire in the order they were started
+    if a_first:
+        a = svc.call_later(50, on_a)
+        timers["b"] = svc.call_every(50, on_b)
+    else:
+        timers["b"] = svc.call_every(50, on_b)
+        a = svc.call_later(50, on_a)
+    _run(400)
+    b = timers["b"]
+    assert fired == {"a": 1, "b": 0 if a_first else 1}
+    assert not b.active() and not a.active()
+    assert svc.active() == 0
+
+
+def test_cancel_from_callback_in_same_tick():
+    _cancel_in_same_tick(True)
+    _cancel_in_same_tick(False)
+
+
+def test_restart_from_callback_in_same_tick():
+    svc = TimerService(hw_id=1)
+    fired = []
+    b = svc.call_later(50, lambda t: fired.append("b"))
+    svc.call_later(50, lambda t: b.start(200))
+    _run(120)
+    assert fired == [] or fired == ["b"]  # b fires now only if it came first
+    n = len(fired)
+    _run(250)
+    assert len(fired) == n + 1
+    assert svc.active() == 0
+
+
+if __name__ == "__main__":
+    for name, f in sorted(globals().items()):
+        if name.startswith("test_"):
+            f()
+            print("ok", name)